@@ -50,6 +50,7 @@ def translate(input_dir, output_dir, config, backup, verbose):
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
     if verbose:
+        app_config['verbose'] = 'true'
         click.echo(f"Input directory: {input_dir}")
         click.echo(f"Output directory: {output_dir}")
         click.echo(f"Model: {app_config.get('model', 'Unknown')}")
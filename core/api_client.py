@@ -10,11 +10,18 @@ from typing import Dict, Any, Optional
 import openai
 from openai import OpenAI
 import tiktoken
-from retry import retry
 from core.models import MODEL_DB, ModelProvider
 from core.cloud_client import CloudAIClient, CloudConfig
 
 
+class RateLimitError(Exception):
+    """Raised when the API rejects a request due to rate limiting"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Seconds suggested by the server, if any
+
+
 class APIClient:
     """Client for interacting with translation APIs"""
     
@@ -178,9 +185,26 @@ You will be translating erotic and sexual content. I will provide you with lines
 - Never include any notes, explanations, disclaimers, or anything similar in your response.
 - Check every line to ensure all text inside is in English."""
     
-    @retry(tries=3, delay=2, backoff=2)
     def translate_batch(self, text_batch: Dict[str, str]) -> Dict[str, str]:
-        """Translate a batch of texts"""
+        """Translate a batch of texts, retrying transient failures.
+        
+        RateLimitError is raised straight away; backing off from rate limits
+        (and honoring Retry-After) is left to the caller.
+        """
+        delay = 2
+        for attempt in range(3):
+            try:
+                return self._translate_batch_once(text_batch)
+            except RateLimitError:
+                raise
+            except Exception:
+                if attempt == 2:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+    
+    def _translate_batch_once(self, text_batch: Dict[str, str]) -> Dict[str, str]:
+        """Translate a batch of texts with a single request"""
         if not text_batch:
             return {}
         
@@ -266,12 +290,27 @@ You will be translating erotic and sexual content. I will provide you with lines
                 raise Exception(f"Failed to parse API response as JSON: {e}\\nResponse: {translated_content[:500]}...")
         
         except Exception as e:
-            if "rate limit" in str(e).lower():
-                time.sleep(60)  # Wait 1 minute for rate limit
-                raise e
+            error_msg = str(e).lower()
+            if "quota" not in error_msg and (isinstance(e, openai.RateLimitError) or "rate limit" in error_msg):
+                # Let the caller decide how long to back off
+                raise RateLimitError(str(e), self._get_retry_after(e))
             else:
                 raise Exception(f"API request failed: {str(e)}")
     
+    def _get_retry_after(self, error: Exception) -> Optional[float]:
+        """Read the Retry-After hint (in seconds) from an API error response"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        
+        for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+            value = headers.get(header)
+            if value:
+                try:
+                    return float(value) * scale
+                except ValueError:
+                    continue  # HTTP-date form is not worth parsing here
+        return None
+    
     def count_tokens(self, text: str) -> int:
         """Count tokens in text for cost calculation"""
         try:
@@ -4,13 +4,14 @@ Provider Manager - Handles multiple AI providers with priority and fallback
 
 import json
 import logging
+import threading
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from core.models import ModelProvider, MODEL_DB
-from core.api_client import APIClient
+from core.api_client import APIClient, RateLimitError
 from core.cloud_client import CloudAIClient, CloudConfig
 
 
@@ -45,6 +46,9 @@ class ProviderManager:
         self.providers: Dict[str, ProviderConfig] = {}
         self.status_cache: Dict[str, Tuple[ProviderStatus, float]] = {}
         self.cache_duration = 300  # 5 minutes
+        # One client per provider, so HTTP keep-alive connections are reused across batches
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
         self.load_config()
     
     def add_provider(self, name: str, provider: ModelProvider, config: Dict[str, Any], 
@@ -58,6 +62,7 @@ class ProviderManager:
             config=config.copy(),
             consecutive_failures=0
         )
+        self._clients.pop(name, None)
         self.save_config()
     
     def setup_providers(self, provider_configs: Dict[str, Dict[str, Any]]) -> None:
@@ -84,6 +89,7 @@ class ProviderManager:
             del self.providers[name]
             if name in self.status_cache:
                 del self.status_cache[name]
+            self._clients.pop(name, None)
             self.save_config()
             return True
         return False
@@ -180,8 +186,8 @@ class ProviderManager:
             try:
                 logging.info(f"Attempting translation with provider: {provider.name}")
                 
-                # Create appropriate client
-                client = self._create_client(provider)
+                # Reuse the provider's client (and its open connections)
+                client = self._get_client(provider)
                 
                 # Attempt translation
                 result = client.translate_batch(text_batch)
@@ -216,8 +222,20 @@ class ProviderManager:
         # All providers failed
         error_msg = f"All providers failed. Last error: {last_error}"
         logging.error(error_msg)
+        if isinstance(last_error, RateLimitError):
+            # Keep the retry hint so the caller can back off
+            raise last_error
         raise Exception(error_msg)
     
+    def _get_client(self, provider: ProviderConfig) -> APIClient:
+        """Get the cached client for a provider, creating it on first use"""
+        with self._clients_lock:
+            client = self._clients.get(provider.name)
+            if client is None:
+                client = self._create_client(provider)
+                self._clients[provider.name] = client
+            return client
+    
     def _create_client(self, provider: ProviderConfig) -> APIClient:
         """Create appropriate client for provider"""
         if provider.provider == ModelProvider.LLAMACPP:
@@ -5,7 +5,7 @@ Handles extraction and application of translatable text from .rpy files
 
 import os
 import re
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Iterator
 from pathlib import Path
 
 
@@ -77,25 +77,30 @@ class RenpyProcessor:
     
     def find_rpy_files(self, directory: str) -> List[str]:
         """Find all .rpy files in the game directory"""
+        return sorted(self.iter_rpy_files(directory))
+    
+    def iter_rpy_files(self, directory: str) -> Iterator[str]:
+        """Yield .rpy files from the game directory as they are discovered"""
         game_dir = os.path.join(directory, 'game')
         
         if not os.path.exists(game_dir):
-            return []
-        
-        rpy_files = []
+            return
         
-        # Recursively find .rpy files
-        for root, dirs, files in os.walk(game_dir):
-            # Skip tl directory to avoid processing existing translations
-            if 'tl' in dirs:
-                dirs.remove('tl')
+        pending_dirs = [game_dir]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except OSError:
+                continue
             
-            for file in files:
-                if file.endswith('.rpy'):
-                    file_path = os.path.join(root, file)
-                    rpy_files.append(file_path)
-        
-        return sorted(rpy_files)
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip tl directory to avoid processing existing translations
+                        if entry.name != 'tl':
+                            pending_dirs.append(entry.path)
+                    elif entry.name.endswith('.rpy'):
+                        yield entry.path
     
     def needs_translation(self, file_path: str) -> bool:
         """Check if the .rpy file contains translatable Japanese text"""
@@ -0,0 +1,83 @@
+"""
+Translation Cache - Persists translated strings so reruns skip texts already translated
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable
+
+
+def default_cache_path() -> str:
+    """Per-user location of the translation cache database"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "baconana", "translation_cache.db")
+
+
+class TranslationCache:
+    """SQLite store of translations keyed by a hash of model, target language, prompt and text"""
+    
+    # SQLite caps the number of bound parameters per statement
+    QUERY_CHUNK_SIZE = 500
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # One connection shared by all worker threads; the lock serializes access
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "hash TEXT PRIMARY KEY, original TEXT NOT NULL, translation TEXT NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _hash(text: str, target_language: str, model: str, prompt_hash: str) -> str:
+        return hashlib.sha1(f"{model}\0{target_language}\0{prompt_hash}\0{text}".encode('utf-8')).hexdigest()
+    
+    def get_many(self, texts: Iterable[str], target_language: str, model: str,
+                 prompt_hash: str = '') -> Dict[str, str]:
+        """Return the cached translations for texts, keyed by original text"""
+        texts_by_hash = {self._hash(text, target_language, model, prompt_hash): text for text in texts}
+        hashes = list(texts_by_hash)
+        found = {}
+        
+        with self._lock:
+            for i in range(0, len(hashes), self.QUERY_CHUNK_SIZE):
+                chunk = hashes[i:i + self.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT hash, translation FROM translations WHERE hash IN ({placeholders})", chunk
+                )
+                for text_hash, translation in rows:
+                    found[texts_by_hash[text_hash]] = translation
+        
+        return found
+    
+    def put_many(self, translations: Dict[str, str], target_language: str, model: str,
+                 prompt_hash: str = ''):
+        """Store original -> translation pairs in a single transaction"""
+        rows = [
+            (self._hash(original, target_language, model, prompt_hash), original, translation)
+            for original, translation in translations.items()
+        ]
+        if not rows:
+            return
+        
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?)", rows)
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
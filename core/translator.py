@@ -7,12 +7,23 @@ Wolf RPG Editor, KiriKiri, NScripter games, and Light Novels
 import os
 import json
 import glob
+import hashlib
+import heapq
+import re
+import itertools
+import queue
+import random
+import sqlite3
 import threading
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import cached_property, partial
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable, Iterator
 from PyQt5.QtCore import QThread, pyqtSignal
-from core.api_client import APIClient
+from core.api_client import APIClient, RateLimitError
 from core.provider_manager import ProviderManager
+from core.translation_cache import TranslationCache, default_cache_path
 from core.file_processor import FileProcessor
 from core.renpy_processor import RenpyProcessor
 from core.unity_processor import UnityProcessor
@@ -26,6 +37,56 @@ from core.lune_processor import LuneProcessor
 from core.regex_processor import RegexProcessor
 from core.lightnovel_processor import LightNovelProcessor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib parser handle (or report) non-strict input
+    return json.loads(raw)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON with 2-space indentation"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Exotic types (e.g. big ints) fall back to the stdlib encoder
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# RPG Maker system files that shouldn't be translated
+EXCLUDE_FILES = frozenset({
+    "System.json",
+    "Tilesets.json",
+    "Animations.json",
+    "States.json",
+    "Skills.json",
+    "Items.json",
+    "Weapons.json",
+    "Armors.json",
+    "Enemies.json",
+    "Troops.json",
+    "Classes.json",
+    "Actors.json",
+})
+
+# Characters that are invalid in Windows paths, and runs of backslashes
+INVALID_PATH_CHARS_PATTERN = re.compile(r'[<>:"|?*]')
+REPEATED_BACKSLASH_PATTERN = re.compile(r'\\\\+')
+
+# Minimum time (seconds) between progress signals, unless progress moved by 1% or finished
+PROGRESS_EMIT_INTERVAL = 0.25
+
 
 class TranslationManager(QThread):
     """Manages the translation process"""
@@ -49,59 +110,52 @@ class TranslationManager(QThread):
         # Keep API client for backward compatibility
         self.api_client = APIClient(config)
         
-        self.file_processor = FileProcessor()
-        self.renpy_processor = RenpyProcessor()
-        self.unity_processor = UnityProcessor()
-        self.wolf_processor = WolfProcessor()
-        self.kirikiri_processor = KiriKiriProcessor()
-        self.nscripter_processor = NScripterProcessor()
-        self.livemaker_processor = LiveMakerProcessor()
-        self.tyranobuilder_processor = TyranoBuilderProcessor()
-        self.srpg_studio_processor = SRPGStudioProcessor()
-        self.lune_processor = LuneProcessor()
-        self.regex_processor = RegexProcessor()
-        self.lightnovel_processor = LightNovelProcessor()
+        # Processors are built lazily (see the cached properties below)
         
-        # Detect project type
-        self.is_lightnovel_project = self._detect_lightnovel_project(input_dir)
-        self.is_renpy_project = self.renpy_processor.detect_renpy_project(input_dir)
-        self.is_unity_project = self.unity_processor.detect_unity_project(input_dir)
-        self.is_wolf_project = self.wolf_processor.detect_wolf_project(input_dir)
-        self.is_kirikiri_project = self.kirikiri_processor.detect_kirikiri_project(input_dir)
-        self.is_nscripter_project = self.nscripter_processor.detect_nscripter_project(input_dir)
-        self.is_livemaker_project = len(self.livemaker_processor.find_livemaker_files(input_dir)) > 0
-        self.is_tyranobuilder_project = len(self.tyranobuilder_processor.find_tyranobuilder_files(input_dir)) > 0
-        self.is_srpg_studio_project = len(self.srpg_studio_processor.find_srpg_studio_files(input_dir)) > 0
-        self.is_lune_project = len(self.lune_processor.find_lune_files(input_dir)) > 0
-        self.is_regex_project = len(self.regex_processor.find_regex_files(input_dir)) > 0
+        # Detect project type. Engines are probed in the same order run() dispatches
+        # them and probing stops at the first hit, so only one processor gets built.
+        self.is_lightnovel_project = False
+        self.is_renpy_project = False
+        self.is_unity_project = False
+        self.is_wolf_project = False
+        self.is_kirikiri_project = False
+        self.is_nscripter_project = False
+        self.is_livemaker_project = False
+        self.is_tyranobuilder_project = False
+        self.is_srpg_studio_project = False
+        self.is_lune_project = False
+        self.is_regex_project = False
+        self.project_type = "RPG Maker"
         
-        if self.is_lightnovel_project:
-            self.project_type = "Light Novel"
-        elif self.is_renpy_project:
-            self.project_type = "Ren'Py"
-        elif self.is_unity_project:
-            self.project_type = "Unity"
-        elif self.is_wolf_project:
-            self.project_type = "Wolf RPG Editor"
-        elif self.is_kirikiri_project:
-            self.project_type = "KiriKiri"
-        elif self.is_nscripter_project:
-            self.project_type = "NScripter"
-        elif self.is_livemaker_project:
-            self.project_type = "Live Maker"
-        elif self.is_tyranobuilder_project:
-            self.project_type = "TyranoBuilder"
-        elif self.is_srpg_studio_project:
-            self.project_type = "SRPG Studio"
-        elif self.is_lune_project:
-            self.project_type = "Lune"
-        elif self.is_regex_project:
-            self.project_type = "Regex"
-        else:
-            self.project_type = "RPG Maker"
+        project_probes = [
+            ('is_lightnovel_project', "Light Novel", lambda: self._detect_lightnovel_project(input_dir)),
+            ('is_unity_project', "Unity", lambda: self.unity_processor.detect_unity_project(input_dir)),
+            ('is_wolf_project', "Wolf RPG Editor", lambda: self.wolf_processor.detect_wolf_project(input_dir)),
+            ('is_kirikiri_project', "KiriKiri", lambda: self.kirikiri_processor.detect_kirikiri_project(input_dir)),
+            ('is_nscripter_project', "NScripter", lambda: self.nscripter_processor.detect_nscripter_project(input_dir)),
+            ('is_livemaker_project', "Live Maker", lambda: len(self.livemaker_processor.find_livemaker_files(input_dir)) > 0),
+            ('is_tyranobuilder_project', "TyranoBuilder", lambda: len(self.tyranobuilder_processor.find_tyranobuilder_files(input_dir)) > 0),
+            ('is_srpg_studio_project', "SRPG Studio", lambda: len(self.srpg_studio_processor.find_srpg_studio_files(input_dir)) > 0),
+            ('is_lune_project', "Lune", lambda: len(self.lune_processor.find_lune_files(input_dir)) > 0),
+            ('is_regex_project', "Regex", lambda: len(self.regex_processor.find_regex_files(input_dir)) > 0),
+            ('is_renpy_project', "Ren'Py", lambda: self.renpy_processor.detect_renpy_project(input_dir)),
+        ]
+        
+        for flag_name, project_type, probe in project_probes:
+            if probe():
+                setattr(self, flag_name, True)
+                self.project_type = project_type
+                break
         
         self.is_paused = False
         self.is_stopped = False
+        
+        # Set while running; cleared on pause so workers block without polling
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # Set by stop(); sleeps wait on it so a stop cuts delays and backoff short
+        self._stop_event = threading.Event()
+        
         self.current_file = 0
         self.total_files = 0
         
@@ -109,6 +163,22 @@ class TranslationManager(QThread):
         self.file_threads = int(config.get('fileThreads', 1))
         self.translation_threads = int(config.get('threads', 1))
         
+        # Per-batch previews are only logged in verbose mode; each emit crosses into the UI thread
+        self.verbose = str(config.get('verbose', 'false')).lower() in ('1', 'true', 'yes')
+        
+        # Translated files are handed to a background writer so workers can start the next batch
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+        
+        # Each emit is a cross-thread UI event, so progress is throttled; the GUI
+        # coalesces log lines on its own timer
+        self._progress_lock = threading.Lock()
+        self._last_progress = (0.0, 0)  # (time, current) of the last progress signal
+        
+        # Translations persist across runs in the user's cache directory; an empty
+        # translation_cache path disables the cache
+        self.translation_cache = self._open_translation_cache(config.get('translation_cache', default_cache_path()))
+        
         # Clean and normalize output directory path
         output_dir = self._clean_directory_path(output_dir)
         self.output_dir = output_dir
@@ -123,14 +193,76 @@ class TranslationManager(QThread):
             self.output_dir = safe_output_dir
             print(f"Warning: Could not create output directory '{output_dir}': {e}")
             print(f"Using fallback directory: {safe_output_dir}")
+        
+        # Path prefixes for get_output_path; discovered files are always built from input_dir
+        self._input_prefix = os.path.join(self.input_dir, '')
+        self._output_prefix = os.path.join(self.output_dir, '')
+    
+    @cached_property
+    def file_processor(self) -> FileProcessor:
+        return FileProcessor()
+    
+    @cached_property
+    def renpy_processor(self) -> RenpyProcessor:
+        return RenpyProcessor()
+    
+    @cached_property
+    def unity_processor(self) -> UnityProcessor:
+        return UnityProcessor()
+    
+    @cached_property
+    def wolf_processor(self) -> WolfProcessor:
+        return WolfProcessor()
+    
+    @cached_property
+    def kirikiri_processor(self) -> KiriKiriProcessor:
+        return KiriKiriProcessor()
+    
+    @cached_property
+    def nscripter_processor(self) -> NScripterProcessor:
+        return NScripterProcessor()
+    
+    @cached_property
+    def livemaker_processor(self) -> LiveMakerProcessor:
+        return LiveMakerProcessor()
+    
+    @cached_property
+    def tyranobuilder_processor(self) -> TyranoBuilderProcessor:
+        return TyranoBuilderProcessor()
+    
+    @cached_property
+    def srpg_studio_processor(self) -> SRPGStudioProcessor:
+        return SRPGStudioProcessor()
+    
+    @cached_property
+    def lune_processor(self) -> LuneProcessor:
+        return LuneProcessor()
+    
+    @cached_property
+    def regex_processor(self) -> RegexProcessor:
+        return RegexProcessor()
+    
+    @cached_property
+    def lightnovel_processor(self) -> LightNovelProcessor:
+        return LightNovelProcessor()
+    
+    def _open_translation_cache(self, db_path: str) -> Optional[TranslationCache]:
+        """Open the on-disk translation cache, or return None if it is disabled or unusable"""
+        if not db_path:
+            return None
+        
+        try:
+            return TranslationCache(db_path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not open translation cache '{db_path}': {e}")
+            return None
     
     def _clean_directory_path(self, path: str) -> str:
         """Clean directory path by removing invalid characters"""
-        import re
         # Remove or replace invalid characters for Windows paths
-        cleaned = re.sub(r'[<>:"|?*]', '_', path)
+        cleaned = INVALID_PATH_CHARS_PATTERN.sub('_', path)
         # Replace multiple backslashes with single ones
-        cleaned = re.sub(r'\\\\+', '\\\\', cleaned)
+        cleaned = REPEATED_BACKSLASH_PATTERN.sub('\\\\', cleaned)
         # Remove trailing spaces and dots
         cleaned = cleaned.rstrip(' .')
         return cleaned
@@ -138,12 +270,12 @@ class TranslationManager(QThread):
     def setup_providers(self, provider_configs: Dict[str, Dict[str, Any]]):
         """Setup multiple providers with configurations"""
         self.provider_manager.setup_providers(provider_configs)
-        self.log_message.emit(f"Configured {len(provider_configs)} providers")
+        self._log(f"Configured {len(provider_configs)} providers")
     
     def run(self):
         """Main translation process"""
         try:
-            self.log_message.emit(f"Starting translation process for {self.project_type} project...")
+            self._log(f"Starting translation process for {self.project_type} project...")
             
             # Handle different project types
             if self.is_lightnovel_project:
@@ -168,98 +300,160 @@ class TranslationManager(QThread):
                 self.process_regex_project(self.input_dir, self.output_dir, self.config.get('target_language', self.config.get('language', 'English')))
             else:
                 # Handle Ren'Py and RPG Maker with file-based approach
+                # Stream discovery so the first files start translating while the scan continues
                 if self.is_renpy_project:
-                    files_to_process = self.find_rpy_files()
+                    files_to_process = self.renpy_processor.iter_rpy_files(self.input_dir)
                     file_type = ".rpy files"
                 else:
-                    files_to_process = self.find_json_files()
+                    files_to_process = self.iter_json_files()
                     file_type = "JSON files"
                 
-                if not files_to_process:
-                    self.log_message.emit(f"No {file_type} found to translate")
-                    return
-                
-                self.total_files = len(files_to_process)
-                self.log_message.emit(f"Found {self.total_files} {file_type} to process")
+                # Process files concurrently; API calls release the GIL while waiting
+                self._start_writer()
+                try:
+                    files_found = self._process_files_concurrently(files_to_process, file_type)
+                finally:
+                    self._stop_writer()
                 
-                # Process files
-                for i, file_path in enumerate(files_to_process):
-                    if self.is_stopped:
-                        break
-                    
-                    while self.is_paused and not self.is_stopped:
-                        time.sleep(0.1)
-                    
-                    self.current_file = i + 1
-                    filename = os.path.basename(file_path)
-                    
-                    self.progress_updated.emit(self.current_file, self.total_files, filename)
-                    self.log_message.emit(f"Processing: {filename}")
-                    
-                    try:
-                        if self.is_renpy_project:
-                            self.process_rpy_file(file_path)
-                        else:
-                            self.process_json_file(file_path)
-                        self.log_message.emit(f"Completed: {filename}")
-                    except Exception as e:
-                        error_msg = f"Error processing {filename}: {str(e)}"
-                        self.log_message.emit(error_msg)
-                        self.error_occurred.emit(error_msg)
+                if not files_found:
+                    self._log(f"No {file_type} found to translate")
+                    return
             
             if not self.is_stopped:
-                self.log_message.emit("Translation process completed successfully!")
+                self._log("Translation process completed successfully!")
             else:
-                self.log_message.emit("Translation process was stopped")
+                self._log("Translation process was stopped")
                 
         except Exception as e:
             error_msg = f"Critical error in translation process: {str(e)}"
-            self.log_message.emit(error_msg)
+            self._log(error_msg)
             self.error_occurred.emit(error_msg)
+        finally:
+            if self.translation_cache:
+                self.translation_cache.close()
+                self.translation_cache = None
     
-    def find_json_files(self) -> List[str]:
-        """Find all JSON files in the input directory"""
-        json_files = []
+    def _process_files_concurrently(self, files_to_process: Iterable[str], file_type: str) -> int:
+        """Process Ren'Py/RPG Maker files on a pool of fileThreads workers
         
-        # Common RPG Maker file patterns
-        patterns = [
-            "**/*.json",
-            "**/Map*.json",
-            "**/data/*.json"
-        ]
+        Files are scheduled as soon as discovery yields them, largest first
+        among those found so far, so one huge map doesn't finish long after
+        the rest. The total counts the files found so far and is final once
+        discovery finishes. Returns the number of files found.
+        """
+        self.total_files = 0
+        self.current_file = 0
+        workers = max(1, self.file_threads)
+        completed = itertools.count(1)
+        waiting = []  # max-heap of (-size, path) not yet submitted
+        running = set()
+        files_found = 0
         
-        # Exclude system files that shouldn't be translated
-        exclude_patterns = [
-            "System.json",
-            "Tilesets.json",
-            "Animations.json",
-            "States.json",
-            "Skills.json",
-            "Items.json",
-            "Weapons.json",
-            "Armors.json",
-            "Enemies.json",
-            "Troops.json",
-            "Classes.json",
-            "Actors.json"
-        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def submit_largest():
+                # Only keep as many tasks in flight as there are workers, so
+                # files discovered later can still jump ahead by size
+                while waiting and len(running) < workers and not self.is_stopped:
+                    _, file_path = heapq.heappop(waiting)
+                    future = executor.submit(self._process_single_file, file_path)
+                    future.add_done_callback(partial(self._on_file_done, file_path, completed))
+                    running.add(future)
+            
+            for file_path in files_to_process:
+                if self.is_stopped:
+                    break
+                files_found += 1
+                self.total_files = files_found
+                heapq.heappush(waiting, (-self._get_file_size(file_path), file_path))
+                
+                if running:
+                    done, _ = wait(running, timeout=0)
+                    running.difference_update(done)
+                submit_largest()
+            
+            if not files_found:
+                return 0
+            
+            self._log(f"Found {self.total_files} {file_type} to process")
+            # The total is final now; report it even if the throttle would skip it
+            self._emit_progress(self.current_file, self.total_files, "", force=True)
+            
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                running.difference_update(done)
+                submit_largest()
         
-        for pattern in patterns:
-            search_path = os.path.join(self.input_dir, pattern)
-            found_files = glob.glob(search_path, recursive=True)
-            
-            for file_path in found_files:
-                filename = os.path.basename(file_path)
-                
-                # Skip excluded files
-                if any(exclude in filename for exclude in exclude_patterns):
-                    continue
-                
-                # Only add if not already in list
-                if file_path not in json_files:
-                    json_files.append(file_path)
+        self._emit_progress(self.current_file, self.total_files, "", force=True)
+        return files_found
+    
+    def _get_file_size(self, file_path: str) -> int:
+        """Size used to schedule large files first; unreadable files sort last"""
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+    
+    def _on_file_done(self, file_path: str, completed: Iterator[int], future: Future):
+        """Report progress and errors for a finished file task"""
+        if future.cancelled():
+            return
+        
+        filename = os.path.basename(file_path)
+        self.current_file = next(completed)
+        self._emit_progress(self.current_file, self.total_files, filename)
+        
+        try:
+            if future.result():
+                self._log(f"Completed: {filename}")
+        except Exception as e:
+            error_msg = f"Error processing {filename}: {str(e)}"
+            self._log(error_msg)
+            self.error_occurred.emit(error_msg)
+    
+    def _process_single_file(self, file_path: str) -> bool:
+        """Worker task for a single file; returns False if skipped due to stop"""
+        if self.is_stopped:
+            return False
         
-        return sorted(json_files)
+        self._resume_event.wait()
+        
+        if self.is_stopped:
+            return False
+        
+        self._log(f"Processing: {os.path.basename(file_path)}")
+        
+        if self.is_renpy_project:
+            self.process_rpy_file(file_path)
+        else:
+            self.process_json_file(file_path)
+        return True
+    
+    def find_json_files(self) -> List[str]:
+        """Find all JSON files in the input directory"""
+        return sorted(self.iter_json_files())
+    
+    def iter_json_files(self) -> Iterator[str]:
+        """Yield translatable JSON files from the input directory as they are discovered"""
+        pending_dirs = [self.input_dir]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    # Hidden entries were never matched by the old glob patterns
+                    if entry.name.startswith('.'):
+                        continue
+                    
+                    if entry.is_dir():
+                        pending_dirs.append(entry.path)
+                    elif entry.name.endswith('.json'):
+                        # Skip excluded files
+                        if entry.name in EXCLUDE_FILES:
+                            continue
+                        yield entry.path
     
     def find_rpy_files(self) -> List[str]:
         """Find all .rpy files in the game directory"""
@@ -272,22 +466,24 @@ class TranslationManager(QThread):
     def process_rpy_file(self, file_path: str):
         """Process a single .rpy file (Ren'Py)"""
         try:
+            filename = os.path.basename(file_path)
+            
             # Check if file needs translation
             if not self.renpy_processor.needs_translation(file_path):
-                self.log_message.emit(f"Skipping {os.path.basename(file_path)} - no translatable content")
+                self._log(f"Skipping {filename} - no translatable content")
                 return
             
             # Extract translatable text
             translatable_texts = self.renpy_processor.extract_translatable_text(file_path)
             
             if not translatable_texts:
-                self.log_message.emit(f"No translatable text found in {os.path.basename(file_path)}")
+                self._log(f"No translatable text found in {filename}")
                 return
             
             # Convert to simple list for translation
             texts_to_translate = [text for text, context, line_num in translatable_texts]
             
-            self.log_message.emit(f"Found {len(texts_to_translate)} strings to translate in {os.path.basename(file_path)}")
+            self._log(f"Found {len(texts_to_translate)} strings to translate in {filename}")
             
             # Translate the texts
             translated_texts = self.translate_texts(texts_to_translate)
@@ -297,7 +493,8 @@ class TranslationManager(QThread):
             for i, (original_text, context, line_num) in enumerate(translatable_texts):
                 if i < len(translated_texts):
                     translation_map[original_text] = translated_texts[i]
-                    self.log_message.emit(f"Line {line_num}: '{original_text[:50]}...' -> '{translated_texts[i][:50]}...'")
+                    if self.verbose:
+                        self._log(f"Line {line_num}: '{original_text[:50]}...' -> '{translated_texts[i][:50]}...'")
             
             # Create Ren'Py translation file
             game_dir = os.path.join(self.input_dir, 'game')
@@ -307,7 +504,7 @@ class TranslationManager(QThread):
                 file_path, translation_map, target_language, game_dir
             )
             
-            self.log_message.emit(f"Created translation file: {translation_file}")
+            self._log(f"Created translation file: {translation_file}")
             
         except Exception as e:
             raise Exception(f"Failed to process Ren'Py file {file_path}: {str(e)}")
@@ -315,20 +512,22 @@ class TranslationManager(QThread):
     def process_file(self, file_path: str):
         """Process a single JSON file"""
         try:
+            filename = os.path.basename(file_path)
+            
             # Read the JSON file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _load_json_bytes(f.read())
             
             # Check if file needs translation
             if not self.file_processor.needs_translation(data):
-                self.log_message.emit(f"Skipping {os.path.basename(file_path)} - no translatable content")
+                self._log(f"Skipping {filename} - no translatable content")
                 return
             
             # Extract translatable text
             translatable_texts = self.file_processor.extract_translatable_text(data)
             
             if not translatable_texts:
-                self.log_message.emit(f"No translatable text found in {os.path.basename(file_path)}")
+                self._log(f"No translatable text found in {filename}")
                 return
             
             # Translate the texts
@@ -339,596 +538,570 @@ class TranslationManager(QThread):
             
             # Save translated file
             output_path = self.get_output_path(file_path)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            payload = _dump_json_bytes(translated_data)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(translated_data, f, ensure_ascii=False, indent=2)
-            
-            self.log_message.emit(f"Saved translated file: {output_path}")
+            if self._writer_thread is not None:
+                self._write_queue.put((output_path, payload))
+            else:
+                self._write_file(output_path, payload)
             
         except Exception as e:
             raise Exception(f"Failed to process file {file_path}: {str(e)}")
     
+    def _log(self, message: str):
+        """Log a message, one signal per line so the GUI timestamps each line"""
+        self.log_message.emit(message)
+    
+    def _emit_progress(self, current: int, total: int, filename: str, force: bool = False):
+        """Emit progress when it moved by 1%, PROGRESS_EMIT_INTERVAL passed, the run finished,
+        or force is set"""
+        now = time.monotonic()
+        with self._progress_lock:
+            last_time, last_current = self._last_progress
+            # An unknown total (0) is throttled by time alone
+            finished = 0 < total <= current
+            if (not force and not finished and now - last_time < PROGRESS_EMIT_INTERVAL
+                    and (not total or current - last_current < max(1, total // 100))):
+                return
+            self._last_progress = (now, current)
+        self.progress_updated.emit(current, total, filename)
+    
+    def _start_writer(self):
+        """Start the background thread that saves translated files"""
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="TranslationWriter", daemon=True)
+        self._writer_thread.start()
+    
+    def _stop_writer(self):
+        """Flush pending writes and stop the writer thread"""
+        if self._writer_thread is None:
+            return
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+    
+    def _writer_loop(self):
+        """Write queued (output_path, payload) items until a None sentinel arrives"""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            
+            output_path, payload = item
+            try:
+                self._write_file(output_path, payload)
+            except Exception as e:
+                error_msg = f"Failed to save {output_path}: {str(e)}"
+                self._log(error_msg)
+                self.error_occurred.emit(error_msg)
+    
+    def _write_file(self, output_path: str, payload: bytes):
+        """Write a translated file, creating its directory if needed"""
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
+        
+        self._log(f"Saved translated file: {output_path}")
+    
     def translate_texts(self, texts: List[str]) -> List[str]:
-        """Translate a list of texts using the configured providers with fallback"""
+        """Translate a list of texts using the configured providers with fallback
+        
+        Each distinct string is sent once; results are fanned back out in input order.
+        """
+        if not all(isinstance(text, str) for text in texts):
+            # Let the batch validation report the offending item
+            return self._translate_batches(texts)
+        
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            self._log(f"Skipping {len(texts) - len(unique_texts)} duplicate strings")
+        
+        translation_map = self._get_cached_translations(unique_texts)
+        new_texts = [text for text in unique_texts if text not in translation_map]
+        if translation_map:
+            self._log(f"Reusing {len(translation_map)} cached translations")
+        
+        if new_texts:
+            new_translations = dict(zip(new_texts, self._translate_batches(new_texts)))
+            translation_map.update(new_translations)
+            self._store_cached_translations(new_translations)
+        
+        # Stop at the first untranslated text so callers see the same short list as before on stop
+        translated_texts = []
+        for text in texts:
+            if text not in translation_map:
+                break
+            translated_texts.append(translation_map[text])
+        return translated_texts
+    
+    def _cache_scope(self) -> Tuple[str, str, str]:
+        """Target language, model and prompt hash that cached translations are keyed by"""
+        # Editing the prompt or vocabulary, or switching to the light novel prompt,
+        # must not serve translations made under a different prompt
+        prompt = "\0".join((
+            self.config.get('custom_prompt', ''),
+            getattr(self.api_client, 'prompt', ''),
+            getattr(self.api_client, 'vocabulary', ''),
+        ))
+        prompt_hash = hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+        return (self.config.get('target_language', self.config.get('language', 'English')),
+                self.config.get('model', ''),
+                prompt_hash)
+    
+    def _get_cached_translations(self, texts: List[str]) -> Dict[str, str]:
+        """Look up texts in the on-disk cache"""
+        if not self.translation_cache:
+            return {}
+        
+        try:
+            return self.translation_cache.get_many(texts, *self._cache_scope())
+        except sqlite3.Error as e:
+            self._log(f"Translation cache lookup failed: {e}")
+            return {}
+    
+    def _store_cached_translations(self, translations: Dict[str, str]):
+        """Save new translations to the on-disk cache"""
+        if not self.translation_cache:
+            return
+        
+        # Failed batches fall back to the original text; don't persist those
+        translations = {original: translation for original, translation in translations.items()
+                        if translation != original}
+        try:
+            self.translation_cache.put_many(translations, *self._cache_scope())
+        except sqlite3.Error as e:
+            self._log(f"Translation cache update failed: {e}")
+    
+    def _translate_batches(self, texts: List[str]) -> List[str]:
+        """Send texts to the providers in batch_size chunks"""
         batch_size = int(self.config.get('batchsize', 10))
         translated_texts = []
         
-        self.log_message.emit(f"Starting translation of {len(texts)} text strings in batches of {batch_size}")
+        self._log(f"Starting translation of {len(texts)} text strings in batches of {batch_size}")
+        
+        total_batches, remainder = divmod(len(texts), batch_size)
+        total_batches += bool(remainder)
+        
+        # Line keys are the same for every batch; the last batch uses a prefix
+        batch_keys = [f"Line{j+1}" for j in range(batch_size)]
         
         # Process texts in batches
-        for i in range(0, len(texts), batch_size):
+        for batch_num, i in enumerate(range(0, len(texts), batch_size), 1):
             if self.is_stopped:
                 break
                 
-            while self.is_paused and not self.is_stopped:
-                time.sleep(0.1)
+            self._resume_event.wait()
             
             batch = texts[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(texts) + batch_size - 1) // batch_size
+            keys = batch_keys[:len(batch)]
             
-            self.log_message.emit(f"Processing batch {batch_num}/{total_batches} ({len(batch)} strings)")
+            self._log(f"Processing batch {batch_num}/{total_batches} ({len(batch)} strings)")
             
             # Log first few lines being translated for debugging
-            if len(batch) > 0:
+            if self.verbose and len(batch) > 0:
                 # Debug: Check what type of data we have in batch
-                self.log_message.emit(f"Debug: Batch item 0 type: {type(batch[0])}")
+                self._log(f"Debug: Batch item 0 type: {type(batch[0])}")
                 if isinstance(batch[0], str):
                     preview = batch[0][:100] + "..." if len(batch[0]) > 100 else batch[0]
-                    self.log_message.emit(f"Translating: {preview}")
+                    self._log(f"Translating: {preview}")
                 else:
-                    self.log_message.emit(f"Error: Batch contains non-string item: {type(batch[0])} - {batch[0]}")
+                    self._log(f"Error: Batch contains non-string item: {type(batch[0])} - {batch[0]}")
                     return []
             
             try:
                 # Validate all items in batch are strings
                 for idx, text in enumerate(batch):
                     if not isinstance(text, str):
-                        self.log_message.emit(f"Error: Batch item {idx} is not a string: {type(text)} - {text}")
+                        self._log(f"Error: Batch item {idx} is not a string: {type(text)} - {text}")
                         return []
                 
                 # Prepare batch for translation
-                batch_dict = {f"Line{j+1}": text for j, text in enumerate(batch)}
+                batch_dict = dict(zip(keys, batch))
                 
                 # Try translation with provider manager (with fallback)
-                self.log_message.emit("Attempting translation with provider fallback...")
-                try:
-                    translated_batch = self.provider_manager.translate_with_fallback(
-                        batch_dict, 
-                        self.config.get('target_language', 'en')
-                    )
-                except Exception as provider_error:
-                    # Fall back to direct API client if provider manager fails
-                    self.log_message.emit(f"Provider manager failed: {provider_error}")
-                    self.log_message.emit(f"Falling back to direct API: {self.config.get('model', 'API')}...")
-                    translated_batch = self.api_client.translate_batch(batch_dict)
+                translated_batch = self._request_batch_with_backoff(batch_dict)
                 
                 # Extract translated texts in order
                 successful_translations = 0
-                for j in range(len(batch)):
-                    key = f"Line{j+1}"
+                for j, key in enumerate(keys):
                     if key in translated_batch:
                         translated_text = translated_batch[key]
                         translated_texts.append(translated_text)
                         successful_translations += 1
                         
                         # Log translation preview for first item in batch
-                        if j == 0:
+                        if self.verbose and j == 0:
                             preview = translated_text[:100] + "..." if len(translated_text) > 100 else translated_text
-                            self.log_message.emit(f"Translation result: {preview}")
+                            self._log(f"Translation result: {preview}")
                     else:
                         # Fallback to original if translation failed
                         translated_texts.append(batch[j])
-                        self.log_message.emit(f"Translation failed for: {batch[j][:50]}...")
+                        self._log(f"Translation failed for: {batch[j][:50]}...")
                 
-                self.log_message.emit(f"Batch completed: {successful_translations}/{len(batch)} translations successful")
+                self._log(f"Batch completed: {successful_translations}/{len(batch)} translations successful")
                 
                 # Small delay to avoid hitting rate limits
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
                 
             except Exception as e:
                 error_msg = str(e)
-                self.log_message.emit(f"Batch translation error: {error_msg}")
+                self._log(f"Batch translation error: {error_msg}")
                 
                 # Check for specific error types
-                if "rate limit" in error_msg.lower():
-                    self.log_message.emit("Rate limit detected - waiting 60 seconds...")
-                    time.sleep(60)
+                if isinstance(e, RateLimitError) or "rate limit" in error_msg.lower():
+                    self._log("Rate limit persisted after retries - keeping original texts for this batch")
                 elif "quota" in error_msg.lower():
-                    self.log_message.emit("API quota exceeded - stopping translation")
+                    self._log("API quota exceeded - stopping translation")
                     self.is_stopped = True
                     break
                 elif "unauthorized" in error_msg.lower():
-                    self.log_message.emit("API key invalid or unauthorized - stopping translation")
+                    self._log("API key invalid or unauthorized - stopping translation")
                     self.is_stopped = True
                     break
                 
                 # Add original texts as fallback
                 translated_texts.extend(batch)
         
-        self.log_message.emit(f"Translation completed: {len(translated_texts)} strings processed")
+        self._log(f"Translation completed: {len(translated_texts)} strings processed")
         return translated_texts
     
+    def _request_batch(self, batch_dict: Dict[str, str]) -> Dict[str, str]:
+        """Translate one batch with the provider manager, falling back to the direct API client"""
+        if self.verbose:
+            self._log("Attempting translation with provider fallback...")
+        try:
+            return self.provider_manager.translate_with_fallback(
+                batch_dict, 
+                self.config.get('target_language', 'en')
+            )
+        except RateLimitError:
+            # Leave backing off to _request_batch_with_backoff instead of hitting
+            # the rate-limited endpoint again through the direct client
+            raise
+        except Exception as provider_error:
+            # Fall back to direct API client if provider manager fails
+            self._log(f"Provider manager failed: {provider_error}")
+            self._log(f"Falling back to direct API: {self.config.get('model', 'API')}...")
+            return self.api_client.translate_batch(batch_dict)
+    
+    def _request_batch_with_backoff(self, batch_dict: Dict[str, str]) -> Dict[str, str]:
+        """Request a batch, retrying with exponential backoff while rate limited"""
+        max_retries = int(self.config.get('rate_limit_retries', 5))
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return self._request_batch(batch_dict)
+            except RateLimitError as e:
+                if attempt == max_retries or self.is_stopped:
+                    raise
+                
+                # Honor the server's Retry-After hint, otherwise back off with jitter
+                if e.retry_after is not None:
+                    delay = e.retry_after
+                else:
+                    delay = min(60, 2 ** attempt) + random.random()
+                self._log(f"Rate limit detected - retrying in {delay:.1f} seconds...")
+                if self._stop_event.wait(delay):
+                    raise
+    
     def get_output_path(self, input_path: str) -> str:
         """Get output path for translated file"""
+        if input_path.startswith(self._input_prefix):
+            # Fast path: swap the directory prefix instead of relpath + join
+            return self._output_prefix + input_path[len(self._input_prefix):]
         rel_path = os.path.relpath(input_path, self.input_dir)
         return os.path.join(self.output_dir, rel_path)
     
     def pause(self):
         """Pause the translation process"""
         self.is_paused = True
+        self._resume_event.clear()
     
     def resume(self):
         """Resume the translation process"""
         self.is_paused = False
+        self._resume_event.set()
     
     def stop(self):
         """Stop the translation process"""
         self.is_stopped = True
         self.is_paused = False
+        self._stop_event.set()
+        # Wake any paused workers so they can see the stop flag
+        self._resume_event.set()
     
     def detect_unity_project(self, game_dir: str) -> bool:
         """Detect if this is a Unity project"""
-        unity_processor = UnityProcessor()
-        return unity_processor.detect_unity_project(game_dir)
+        return self.unity_processor.detect_unity_project(game_dir)
     
     def process_unity_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process Unity localization files"""
-        try:
-            unity_processor = UnityProcessor()
-            
-            # Extract translatable texts
-            self.log_message.emit("Extracting texts from Unity localization files...")
-            translatable_files = unity_processor.find_unity_text_files(game_dir)
-            
-            if not translatable_files:
-                self.log_message.emit("No Unity localization files found")
-                return
-            
-            self.log_message.emit(f"Found {len(translatable_files)} localization files")
-            
-            for file_path in translatable_files:
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing Unity file: {filename}")
-                
-                # Extract texts
-                texts_to_translate = unity_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                # Translate texts
-                text_list = [text for key, text, file_path in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation mapping
-                translation_map = {}
-                for i, (key, text, _) in enumerate(texts_to_translate):
-                    if i < len(translated_texts):
-                        translation_map[key] = translated_texts[i]
-                
-                # Apply translations and save
-                unity_processor.create_translation_file(file_path, translation_map, output_dir, target_language)
-                self.log_message.emit(f"Saved translated file: {filename}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing Unity project: {str(e)}")
-            raise
+        self._process_generic_project(self.unity_processor, "find_unity_text_files", "Unity",
+                                      game_dir, output_dir, target_language)
     
     def process_wolf_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process Wolf RPG Editor files"""
-        try:
-            wolf_processor = WolfProcessor()
-            
-            self.log_message.emit("Extracting texts from Wolf RPG Editor files...")
-            wolf_files = wolf_processor.find_wolf_text_files(game_dir)
-            
-            if not wolf_files:
-                self.log_message.emit("No Wolf RPG Editor files found")
-                return
-            
-            self.log_message.emit(f"Found {len(wolf_files)} Wolf files")
-            
-            for file_path in wolf_files:
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing Wolf file: {filename}")
-                
-                texts_to_translate = wolf_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for key, text, file_path in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                translation_map = {}
-                for i, (key, text, _) in enumerate(texts_to_translate):
-                    if i < len(translated_texts):
-                        translation_map[key] = translated_texts[i]
-                
-                wolf_processor.create_translation_file(file_path, translation_map, output_dir, target_language)
-                self.log_message.emit(f"Saved translated file: {filename}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing Wolf project: {str(e)}")
-            raise
+        self._process_generic_project(self.wolf_processor, "find_wolf_text_files", "Wolf RPG Editor",
+                                      game_dir, output_dir, target_language)
     
     def process_kirikiri_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process KiriKiri files"""
-        try:
-            kirikiri_processor = KiriKiriProcessor()
-            
-            self.log_message.emit("Extracting texts from KiriKiri files...")
-            kirikiri_files = kirikiri_processor.find_kirikiri_text_files(game_dir)
-            
-            if not kirikiri_files:
-                self.log_message.emit("No KiriKiri files found")
-                return
-            
-            self.log_message.emit(f"Found {len(kirikiri_files)} KiriKiri files")
-            
-            for file_path in kirikiri_files:
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing KiriKiri file: {filename}")
-                
-                texts_to_translate = kirikiri_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for key, text, file_path in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                translation_map = {}
-                for i, (key, text, _) in enumerate(texts_to_translate):
-                    if i < len(translated_texts):
-                        translation_map[key] = translated_texts[i]
-                
-                kirikiri_processor.create_translation_file(file_path, translation_map, output_dir, target_language)
-                self.log_message.emit(f"Saved translated file: {filename}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing KiriKiri project: {str(e)}")
-            raise
+        self._process_generic_project(self.kirikiri_processor, "find_kirikiri_text_files", "KiriKiri",
+                                      game_dir, output_dir, target_language)
     
     def process_nscripter_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process NScripter files"""
+        self._process_generic_project(self.nscripter_processor, "find_nscripter_text_files", "NScripter",
+                                      game_dir, output_dir, target_language)
+    
+    def _process_generic_project(self, processor: Any, find_attr: str, label: str,
+                                 game_dir: str, output_dir: str, target_language: str):
+        """Process an engine whose processor extracts (key, text, file_path) tuples
+        and writes translations keyed by those keys"""
         try:
-            nscripter_processor = NScripterProcessor()
-            
-            self.log_message.emit("Extracting texts from NScripter files...")
-            nscripter_files = nscripter_processor.find_nscripter_text_files(game_dir)
+            self._log(f"Extracting texts from {label} files...")
+            files_to_process = getattr(processor, find_attr)(game_dir)
             
-            if not nscripter_files:
-                self.log_message.emit("No NScripter files found")
+            if not files_to_process:
+                self._log(f"No {label} files found")
                 return
             
-            self.log_message.emit(f"Found {len(nscripter_files)} NScripter files")
-            
-            for file_path in nscripter_files:
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing NScripter file: {filename}")
-                
-                texts_to_translate = nscripter_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for key, text, file_path in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                translation_map = {}
-                for i, (key, text, _) in enumerate(texts_to_translate):
-                    if i < len(translated_texts):
-                        translation_map[key] = translated_texts[i]
+            self._log(f"Found {len(files_to_process)} {label} files")
+            
+            # Texts from several files share one translate_texts run; flush once this many are queued
+            text_limit = max(1, int(self.config.get('project_batch_limit', 256)))
+            pending_files = []  # (file_path, offset into pending_texts, extracted tuples)
+            pending_texts = []
+            # Translations from earlier flushes, so strings repeated across files are sent once
+            known_translations = {}
+            
+            workers = max(1, self.file_threads)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Extraction runs ahead on the pool while earlier files are translated
+                prefetched = self._iter_prefetched(executor, processor.extract_translatable_text,
+                                                   files_to_process, workers + 1)
+                for file_path, future in prefetched:
+                    if self.is_stopped:
+                        break
+                    
+                    self._resume_event.wait()
+                    
+                    filename = os.path.basename(file_path)
+                    self._log(f"Processing {label} file: {filename}")
+                    
+                    # Extract texts
+                    texts_to_translate = future.result()
+                    
+                    if not texts_to_translate:
+                        self._log(f"No translatable texts found in {filename}")
+                        continue
+                    
+                    self._log(f"Found {len(texts_to_translate)} translatable texts in {filename}")
+                    
+                    pending_files.append((file_path, len(pending_texts), texts_to_translate))
+                    pending_texts.extend(text for key, text, _ in texts_to_translate)
+                    
+                    if len(pending_texts) >= text_limit:
+                        self._flush_generic_project(executor, processor, label, output_dir, target_language,
+                                                    pending_files, pending_texts, known_translations)
+                        pending_files = []
+                        pending_texts = []
+                prefetched.close()
                 
-                nscripter_processor.create_translation_file(file_path, translation_map, output_dir, target_language)
-                self.log_message.emit(f"Saved translated file: {filename}")
+                if pending_files:
+                    self._flush_generic_project(executor, processor, label, output_dir, target_language,
+                                                pending_files, pending_texts, known_translations)
                 
         except Exception as e:
-            self.log_message.emit(f"Error processing NScripter project: {str(e)}")
+            self._log(f"Error processing {label} project: {str(e)}")
             raise
     
-    def process_livemaker_project(self, game_dir: str, output_dir: str, target_language: str):
-        """Process Live Maker project files"""
-        try:
-            livemaker_processor = self.livemaker_processor
-            files_to_process = livemaker_processor.find_livemaker_files(game_dir)
-            
-            if not files_to_process:
-                self.log_message.emit("No Live Maker files found to translate")
-                return
-            
-            self.total_files = len(files_to_process)
-            self.log_message.emit(f"Found {self.total_files} Live Maker files to process")
+    def _flush_generic_project(self, executor: ThreadPoolExecutor, processor: Any, label: str,
+                               output_dir: str, target_language: str,
+                               pending_files: List[Tuple[str, int, List[Tuple[str, str, str]]]],
+                               pending_texts: List[str], known_translations: Dict[str, str]):
+        """Translate the texts of several files in one run and write each translated file"""
+        translated_texts = self._translate_pending(label, pending_files, pending_texts, known_translations)
+        
+        write_futures = []
+        for file_path, offset, texts_to_translate in pending_files:
+            if offset >= len(translated_texts):
+                # Translation stopped before reaching this file
+                break
             
-            os.makedirs(output_dir, exist_ok=True)
+            # Create translation mapping
+            translation_map = {}
+            for i, (key, text, _) in enumerate(texts_to_translate, offset):
+                if i < len(translated_texts):
+                    translation_map[key] = translated_texts[i]
             
-            for i, file_path in enumerate(files_to_process):
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                self.current_file = i + 1
-                self.progress_updated.emit(self.current_file, self.total_files, os.path.basename(file_path))
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing Live Maker file: {filename}")
-                
-                texts_to_translate = livemaker_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for text, context, text_type in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation file
-                translation_data = []
-                for i, (original, context, text_type) in enumerate(texts_to_translate):
-                    translation = translated_texts[i] if i < len(translated_texts) else original
-                    translation_data.append((original, translation, context))
-                
-                output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
-                livemaker_processor.create_translation_file(translation_data, output_file)
-                self.log_message.emit(f"Saved translated file: {os.path.basename(output_file)}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing Live Maker project: {str(e)}")
-            raise
+            # Apply translations and save
+            write_futures.append((file_path, executor.submit(
+                processor.create_translation_file, file_path, translation_map, output_dir, target_language
+            )))
+        
+        for file_path, future in write_futures:
+            future.result()
+            self._log(f"Saved translated file: {os.path.basename(file_path)}")
+    
+    def _translate_pending(self, label: str, pending_files: List[Tuple[str, int, list]],
+                           pending_texts: List[str], known_translations: Dict[str, str]) -> List[str]:
+        """Translate the queued texts of a project flush, in order
+        
+        known_translations is shared across flushes of a project; only texts missing from it
+        are sent to the providers, and new results are added to it. The result stops at the
+        first untranslated text, so files past a stop are not written.
+        """
+        self._log(f"Translating {len(pending_texts)} texts from {len(pending_files)} {label} files")
+        
+        unique_texts = list(dict.fromkeys(pending_texts))
+        new_texts = [text for text in unique_texts if text not in known_translations]
+        if len(new_texts) < len(unique_texts):
+            self._log(f"Reusing {len(unique_texts) - len(new_texts)} translations from earlier {label} files")
+        if new_texts:
+            # translate_texts stops short when stopped; zip only records what came back
+            known_translations.update(zip(new_texts, self.translate_texts(new_texts)))
+        
+        translated_texts = []
+        for text in pending_texts:
+            if text not in known_translations:
+                break
+            translated_texts.append(known_translations[text])
+        return translated_texts
+    
+    def _iter_prefetched(self, executor: ThreadPoolExecutor, func: Callable[[str], Any],
+                         items: Iterable[str], depth: int) -> Iterator[Tuple[str, Future]]:
+        """Yield (item, future) pairs in order while up to depth calls of func run ahead"""
+        pending = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(func, item)))
+                if len(pending) >= depth:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            # Consumer stopped early; don't start work nobody will read
+            for _, future in pending:
+                future.cancel()
+    
+    def process_livemaker_project(self, game_dir: str, output_dir: str, target_language: str):
+        """Process Live Maker project files"""
+        self._process_text_project(self.livemaker_processor, "find_livemaker_files", "Live Maker",
+                                   game_dir, output_dir, target_language)
     
     def process_tyranobuilder_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process TyranoBuilder project files"""
-        try:
-            tyranobuilder_processor = self.tyranobuilder_processor
-            files_to_process = tyranobuilder_processor.find_tyranobuilder_files(game_dir)
-            
-            if not files_to_process:
-                self.log_message.emit("No TyranoBuilder files found to translate")
-                return
-            
-            self.total_files = len(files_to_process)
-            self.log_message.emit(f"Found {self.total_files} TyranoBuilder files to process")
-            
-            os.makedirs(output_dir, exist_ok=True)
-            
-            for i, file_path in enumerate(files_to_process):
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                self.current_file = i + 1
-                self.progress_updated.emit(self.current_file, self.total_files, os.path.basename(file_path))
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing TyranoBuilder file: {filename}")
-                
-                texts_to_translate = tyranobuilder_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for text, context, text_type in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation file
-                translation_data = []
-                for i, (original, context, text_type) in enumerate(texts_to_translate):
-                    translation = translated_texts[i] if i < len(translated_texts) else original
-                    translation_data.append((original, translation, context))
-                
-                output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
-                tyranobuilder_processor.create_translation_file(translation_data, output_file)
-                self.log_message.emit(f"Saved translated file: {os.path.basename(output_file)}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing TyranoBuilder project: {str(e)}")
-            raise
+        self._process_text_project(self.tyranobuilder_processor, "find_tyranobuilder_files", "TyranoBuilder",
+                                   game_dir, output_dir, target_language)
     
     def process_srpg_studio_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process SRPG Studio project files"""
-        try:
-            srpg_processor = self.srpg_studio_processor
-            files_to_process = srpg_processor.find_srpg_studio_files(game_dir)
-            
-            if not files_to_process:
-                self.log_message.emit("No SRPG Studio files found to translate")
-                return
-            
-            self.total_files = len(files_to_process)
-            self.log_message.emit(f"Found {self.total_files} SRPG Studio files to process")
-            
-            os.makedirs(output_dir, exist_ok=True)
-            
-            for i, file_path in enumerate(files_to_process):
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                self.current_file = i + 1
-                self.progress_updated.emit(self.current_file, self.total_files, os.path.basename(file_path))
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing SRPG Studio file: {filename}")
-                
-                texts_to_translate = srpg_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for text, context, text_type in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation file
-                translation_data = []
-                for i, (original, context, text_type) in enumerate(texts_to_translate):
-                    translation = translated_texts[i] if i < len(translated_texts) else original
-                    translation_data.append((original, translation, context))
-                
-                output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
-                srpg_processor.create_translation_file(translation_data, output_file)
-                self.log_message.emit(f"Saved translated file: {os.path.basename(output_file)}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing SRPG Studio project: {str(e)}")
-            raise
+        self._process_text_project(self.srpg_studio_processor, "find_srpg_studio_files", "SRPG Studio",
+                                   game_dir, output_dir, target_language)
     
     def process_lune_project(self, game_dir: str, output_dir: str, target_language: str):
         """Process Lune project files"""
+        self._process_text_project(self.lune_processor, "find_lune_files", "Lune",
+                                   game_dir, output_dir, target_language)
+    
+    def process_regex_project(self, game_dir: str, output_dir: str, target_language: str):
+        """Process Regex project files"""
+        self._process_text_project(self.regex_processor, "find_regex_files", "Regex",
+                                   game_dir, output_dir, target_language)
+    
+    def _process_text_project(self, processor: Any, find_attr: str, label: str,
+                              game_dir: str, output_dir: str, target_language: str):
+        """Process an engine whose processor extracts (text, context, text_type) tuples
+        and writes one <name>_translation.json per source file"""
         try:
-            lune_processor = self.lune_processor
-            files_to_process = lune_processor.find_lune_files(game_dir)
+            files_to_process = getattr(processor, find_attr)(game_dir)
             
             if not files_to_process:
-                self.log_message.emit("No Lune files found to translate")
+                self._log(f"No {label} files found to translate")
                 return
             
             self.total_files = len(files_to_process)
-            self.log_message.emit(f"Found {self.total_files} Lune files to process")
+            self._log(f"Found {self.total_files} {label} files to process")
             
             os.makedirs(output_dir, exist_ok=True)
             
-            for i, file_path in enumerate(files_to_process):
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                self.current_file = i + 1
-                self.progress_updated.emit(self.current_file, self.total_files, os.path.basename(file_path))
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing Lune file: {filename}")
-                
-                texts_to_translate = lune_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for text, context, text_type in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation file
-                translation_data = []
-                for i, (original, context, text_type) in enumerate(texts_to_translate):
-                    translation = translated_texts[i] if i < len(translated_texts) else original
-                    translation_data.append((original, translation, context))
+            # Texts from several files share one translate_texts run; flush once this many are queued
+            text_limit = max(1, int(self.config.get('project_batch_limit', 256)))
+            pending_files = []  # (filename, offset into pending_texts, extracted tuples)
+            pending_texts = []
+            # Translations from earlier flushes, so strings repeated across files are sent once
+            known_translations = {}
+            
+            workers = max(1, self.file_threads)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Extraction runs ahead on the pool while earlier files are translated
+                prefetched = self._iter_prefetched(executor, processor.extract_translatable_text,
+                                                   files_to_process, workers + 1)
+                for i, (file_path, future) in enumerate(prefetched, 1):
+                    if self.is_stopped:
+                        break
+                    
+                    self._resume_event.wait()
+                    
+                    self.current_file = i
+                    filename = os.path.basename(file_path)
+                    self._emit_progress(self.current_file, self.total_files, filename)
+                    
+                    self._log(f"Processing {label} file: {filename}")
+                    
+                    texts_to_translate = future.result()
+                    
+                    if not texts_to_translate:
+                        self._log(f"No translatable texts found in {filename}")
+                        continue
+                    
+                    self._log(f"Found {len(texts_to_translate)} translatable texts in {filename}")
+                    
+                    pending_files.append((filename, len(pending_texts), texts_to_translate))
+                    pending_texts.extend(text for text, context, text_type in texts_to_translate)
+                    
+                    if len(pending_texts) >= text_limit:
+                        self._flush_text_project(executor, processor, label, output_dir,
+                                                 pending_files, pending_texts, known_translations)
+                        pending_files = []
+                        pending_texts = []
+                prefetched.close()
                 
-                output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
-                lune_processor.create_translation_file(translation_data, output_file)
-                self.log_message.emit(f"Saved translated file: {os.path.basename(output_file)}")
+                if pending_files:
+                    self._flush_text_project(executor, processor, label, output_dir,
+                                             pending_files, pending_texts, known_translations)
                 
         except Exception as e:
-            self.log_message.emit(f"Error processing Lune project: {str(e)}")
+            self._log(f"Error processing {label} project: {str(e)}")
             raise
     
-    def process_regex_project(self, game_dir: str, output_dir: str, target_language: str):
-        """Process Regex project files"""
-        try:
-            regex_processor = self.regex_processor
-            files_to_process = regex_processor.find_regex_files(game_dir)
-            
-            if not files_to_process:
-                self.log_message.emit("No Regex files found to translate")
-                return
-            
-            self.total_files = len(files_to_process)
-            self.log_message.emit(f"Found {self.total_files} Regex files to process")
+    def _flush_text_project(self, executor: ThreadPoolExecutor, processor: Any, label: str, output_dir: str,
+                            pending_files: List[Tuple[str, int, List[Tuple[str, str, str]]]],
+                            pending_texts: List[str], known_translations: Dict[str, str]):
+        """Translate the texts of several files in one run and write each file's translation JSON"""
+        translated_texts = self._translate_pending(label, pending_files, pending_texts, known_translations)
+        
+        write_futures = []
+        for filename, offset, texts_to_translate in pending_files:
+            if offset >= len(translated_texts):
+                # Translation stopped before reaching this file
+                break
             
-            os.makedirs(output_dir, exist_ok=True)
+            # Create translation file
+            translation_data = [
+                (original, translated_texts[j] if j < len(translated_texts) else original, context)
+                for j, (original, context, text_type) in enumerate(texts_to_translate, offset)
+            ]
             
-            for i, file_path in enumerate(files_to_process):
-                if self.is_stopped:
-                    break
-                
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
-                
-                self.current_file = i + 1
-                self.progress_updated.emit(self.current_file, self.total_files, os.path.basename(file_path))
-                
-                filename = os.path.basename(file_path)
-                self.log_message.emit(f"Processing Regex file: {filename}")
-                
-                texts_to_translate = regex_processor.extract_translatable_text(file_path)
-                
-                if not texts_to_translate:
-                    self.log_message.emit(f"No translatable texts found in {filename}")
-                    continue
-                
-                self.log_message.emit(f"Found {len(texts_to_translate)} translatable texts in {filename}")
-                
-                text_list = [text for text, context, text_type in texts_to_translate]
-                translated_texts = self.translate_texts(text_list)
-                
-                # Create translation file
-                translation_data = []
-                for i, (original, context, text_type) in enumerate(texts_to_translate):
-                    translation = translated_texts[i] if i < len(translated_texts) else original
-                    translation_data.append((original, translation, context))
-                
-                output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
-                regex_processor.create_translation_file(translation_data, output_file)
-                self.log_message.emit(f"Saved translated file: {os.path.basename(output_file)}")
-                
-        except Exception as e:
-            self.log_message.emit(f"Error processing Regex project: {str(e)}")
+            output_file = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}_translation.json")
+            write_futures.append((output_file, executor.submit(
+                processor.create_translation_file, translation_data, output_file
+            )))
+        
+        for output_file, future in write_futures:
+            future.result()
+            self._log(f"Saved translated file: {os.path.basename(output_file)}")
     
     def _detect_lightnovel_project(self, input_dir: str) -> bool:
         """Detect if directory contains light novel files"""
@@ -948,7 +1121,7 @@ class TranslationManager(QThread):
     def process_lightnovel_project(self, input_dir: str, output_dir: str, target_language: str):
         """Process light novel files"""
         try:
-            self.log_message.emit("Processing Light Novel project...")
+            self._log("Processing Light Novel project...")
             
             # Find all light novel files
             light_novel_files = []
@@ -962,44 +1135,43 @@ class TranslationManager(QThread):
                         light_novel_files.append(file_path)
             
             if not light_novel_files:
-                self.log_message.emit("No compatible light novel files found")
+                self._log("No compatible light novel files found")
                 return
             
-            self.log_message.emit(f"Found {len(light_novel_files)} light novel files to process")
+            self._log(f"Found {len(light_novel_files)} light novel files to process")
             
             # Process each file
             for i, file_path in enumerate(light_novel_files):
                 if self.is_stopped:
                     break
                 
-                while self.is_paused and not self.is_stopped:
-                    time.sleep(0.1)
+                self._resume_event.wait()
                 
                 filename = os.path.basename(file_path)
-                self.progress_updated.emit(i + 1, len(light_novel_files), filename)
-                self.log_message.emit(f"Processing: {filename}")
+                self._emit_progress(i + 1, len(light_novel_files), filename)
+                self._log(f"Processing: {filename}")
                 
                 # Extract text from file
                 extracted_data = self.lightnovel_processor.extract_text(file_path)
                 
                 if "error" in extracted_data:
-                    self.log_message.emit(f"Error extracting from {filename}: {extracted_data['error']}")
+                    self._log(f"Error extracting from {filename}: {extracted_data['error']}")
                     continue
                 
                 # Get translatable content
                 translatable_content = self.lightnovel_processor.get_translatable_content(extracted_data)
                 
                 if not translatable_content:
-                    self.log_message.emit(f"No translatable content found in {filename}")
+                    self._log(f"No translatable content found in {filename}")
                     continue
                 
-                self.log_message.emit(f"Found {len(translatable_content)} translatable sections")
+                self._log(f"Found {len(translatable_content)} translatable sections")
                 
                 # Debug: Check the structure of translatable_content
                 if translatable_content:
                     first_item = translatable_content[0]
-                    self.log_message.emit(f"Debug: First item type: {type(first_item)}")
-                    self.log_message.emit(f"Debug: First item keys: {list(first_item.keys()) if isinstance(first_item, dict) else 'Not a dict'}")
+                    self._log(f"Debug: First item type: {type(first_item)}")
+                    self._log(f"Debug: First item keys: {list(first_item.keys()) if isinstance(first_item, dict) else 'Not a dict'}")
                 
                 # Prepare texts for translation
                 texts_to_translate = []
@@ -1007,10 +1179,10 @@ class TranslationManager(QThread):
                     if isinstance(item, dict) and "original" in item:
                         texts_to_translate.append(item["original"])
                     else:
-                        self.log_message.emit(f"Warning: Invalid item structure: {type(item)} - {item}")
+                        self._log(f"Warning: Invalid item structure: {type(item)} - {item}")
                 
                 if not texts_to_translate:
-                    self.log_message.emit(f"No valid texts to translate in {filename}")
+                    self._log(f"No valid texts to translate in {filename}")
                     continue
                 
                 # Use light novel specific prompt
@@ -1019,7 +1191,7 @@ class TranslationManager(QThread):
                 self.config['custom_prompt'] = light_novel_prompt
                 
                 # Translate texts
-                self.log_message.emit("Starting translation...")
+                self._log("Starting translation...")
                 translated_texts = self.translate_texts(texts_to_translate)
                 
                 # Restore original prompt
@@ -1044,7 +1216,7 @@ class TranslationManager(QThread):
                     output_path, translatable_content, extracted_data.get("metadata", {}), output_format
                 )
                 
-                self.log_message.emit(f"Saved translated file: {os.path.basename(result_file)}")
+                self._log(f"Saved translated file: {os.path.basename(result_file)}")
                 
                 # Also create a JSON summary for reference
                 summary_file = os.path.join(output_dir, f"{base_name}_translation_summary.json")
@@ -1062,8 +1234,8 @@ class TranslationManager(QThread):
                 with open(summary_file, 'w', encoding='utf-8') as f:
                     json.dump(summary_data, f, ensure_ascii=False, indent=2)
                 
-                self.log_message.emit(f"Saved summary: {os.path.basename(summary_file)}")
+                self._log(f"Saved summary: {os.path.basename(summary_file)}")
                 
         except Exception as e:
-            self.log_message.emit(f"Error processing Light Novel project: {str(e)}")
+            self._log(f"Error processing Light Novel project: {str(e)}")
             raise
@@ -6,129 +6,249 @@ Handles TyranoBuilder (.ks, .tjs) game files
 import os
 import re
 import json
-from typing import List, Tuple, Dict
+import codecs
+import mmap
+import chardet
+from collections import defaultdict
+from typing import List, Tuple, Dict, Iterable, Iterator, Callable
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Buffer size for translated output files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Scripts at least this large are memory-mapped during extraction
+MMAP_THRESHOLD = 1 << 20
+
+# Asset references and engine keywords that are never translated
+MEDIA_EXTENSIONS = ('.jpg', '.png', '.gif', '.wav', '.mp3', '.ogg')
+SYSTEM_STRINGS = frozenset({
+    'true', 'false', 'null', 'undefined',
+    'auto', 'skip', 'save', 'load', 'config'
+})
+
+# chardet results trusted for non-UTF-8 scripts (normalized name -> codec); any
+# other guess is usually a single-byte codec misreading Shift-JIS
+JAPANESE_ENCODINGS = {
+    'shift_jis': 'cp932',
+    'cp932': 'cp932',
+    'windows_31j': 'cp932',
+    'euc_jp': 'euc-jp',
+    'iso_2022_jp': 'iso-2022-jp',
+}
+
 class TyranoBuilderProcessor:
     """Processor for TyranoBuilder engine games"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
+        # Encodings TyranoBuilder scripts are saved in, in fallback order
+        self.encodings = ['utf-8', 'shift-jis', 'cp932']
+        self.sniff_size = 32768  # Bytes read to detect a script's encoding
+        
+        # Patterns for Japanese text detection
+        self.japanese_pattern = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]')
+        
+        # Patterns that identify TyranoScript files
+        self.tyrano_patterns = [
+            re.compile(r'\[([^\]]+)\]'),  # TyranoScript tags
+            re.compile(r'@(\w+)'),         # @ commands
+            re.compile(r'#(\w+)'),         # Character names
+        ]
+        # ASCII tags and line-leading commands can be spotted without decoding
+        self.tyrano_bytes_pattern = re.compile(rb'\[[A-Za-z_]\w*[^\]\r\n]*\]|^[@#]\w', re.MULTILINE)
+        
+        # Character name lines
+        self.character_pattern = re.compile(r'#([^#\n]+)')
+        
+        # Common TyranoScript tags that contain text, as one alternation so each line is scanned once.
+        # Tag prefixes use lookaheads so attributes inside the same tag are still matched afterwards.
+        self.text_tag_pattern = re.compile(
+            r'\[(?:bg|playse|playbgm)\s(?=[^\]]*?storage="([^"]+)")'  # Background, sound effect and music names
+            r'|\[font\s(?=[^\]]*\]([^[]+))'                         # Font formatted text
+            r'|(?:text|name)="([^"]+)"',                            # Text and name attributes (chara_new, button, link, ...)
+            re.IGNORECASE
+        )
+        
+        # Dialogue formatting
+        self.ruby_pattern = re.compile(r'\[ruby[^\]]*\]([^\[]+)\[/ruby\]')
+        self.tag_pattern = re.compile(r'\[/?[^\]]+\]')
+        self.control_pattern = re.compile(r'[@#&*]')
+        
     def find_tyranobuilder_files(self, directory: str) -> List[str]:
         """Find TyranoBuilder script files"""
         tb_files = []
         
-        for root, _, files in os.walk(directory):
-            for file in files:
-                # TyranoBuilder uses .ks files (similar to KiriKiri but different syntax)
-                # Also .tjs files for TyranoScript
-                if file.lower().endswith(('.ks', '.tjs')) and not file.startswith('.'):
-                    file_path = os.path.join(root, file)
-                    
-                    # Check if it's actually TyranoBuilder by looking for specific tags
-                    if self._is_tyranobuilder_file(file_path):
-                        tb_files.append(file_path)
+        for file_path in self._iter_script_files(directory):
+            # Check if it's actually TyranoBuilder by looking for specific tags
+            if self._is_tyranobuilder_file(file_path):
+                tb_files.append(file_path)
         
         return sorted(tb_files)
     
+    def _iter_script_files(self, directory: str) -> Iterator[str]:
+        """Yield .ks/.tjs files under directory, reusing scandir's cached entry types"""
+        pending_dirs = [directory]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    # TyranoBuilder uses .ks files (similar to KiriKiri but different syntax)
+                    # Also .tjs files for TyranoScript
+                    elif entry.name.lower().endswith(('.ks', '.tjs')) and not entry.name.startswith('.'):
+                        yield entry.path
+    
     def _is_tyranobuilder_file(self, file_path: str) -> bool:
         """Check if file is TyranoBuilder format by looking for specific tags"""
         try:
-            encodings = ['utf-8', 'shift-jis', 'cp932']
+            with open(file_path, 'rb') as f:
+                raw = f.read(4096)
             
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read(1000)  # Read first 1000 chars
-                    
-                    # TyranoBuilder specific tags
-                    tyranobuilder_tags = [
-                        '@', '[', ']',  # Basic TyranoScript syntax
-                        'tyrano', 'title', 'start',
-                        'chara_new', 'chara_show', 'chara_hide',
-                        'bg', 'playse', 'playbgm',
-                        'wait', 'l', 'p', 'r'
-                    ]
-                    
-                    # Check for TyranoBuilder patterns
-                    tyrano_patterns = [
-                        r'\[([^\]]+)\]',  # TyranoScript tags
-                        r'@(\w+)',       # @ commands
-                        r'#(\w+)',       # Character names
-                    ]
-                    
-                    for pattern in tyrano_patterns:
-                        if re.search(pattern, content):
-                            return True
-                    
-                    break
-                except UnicodeDecodeError:
-                    continue
+            # 1000 bytes never span more than the first 1000 chars, so a hit here is final
+            if self.tyrano_bytes_pattern.search(raw, 0, 1000):
+                return True
+            
+            # Decode the sniffed bytes once with the detected encoding
+            decoder = codecs.getincrementaldecoder(self._detect_encoding(raw))(errors='replace')
+            content = decoder.decode(raw)[:1000]  # First 1000 chars
+            
+            # Check for TyranoBuilder patterns
+            for pattern in self.tyrano_patterns:
+                if pattern.search(content):
+                    return True
             
         except Exception:
             pass
         
         return False
     
+    def _detect_encoding(self, raw: bytes) -> str:
+        """Detect the encoding of a script from its leading bytes"""
+        if raw.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        
+        try:
+            # Incremental decoding tolerates a character cut off at the end of the sample
+            codecs.getincrementaldecoder('utf-8')().decode(raw)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        # cp932 is the Windows superset of Shift-JIS that TyranoBuilder saves with
+        detected = chardet.detect(raw)['encoding'] or ''
+        return JAPANESE_ENCODINGS.get(detected.lower().replace('-', '_'), 'cp932')
+    
+    def _get_encodings(self, file_path: str) -> List[str]:
+        """Encodings to try for a file, the detected one first"""
+        with open(file_path, 'rb') as f:
+            return self._candidate_encodings(f.read(self.sniff_size))
+    
+    def _candidate_encodings(self, raw: bytes) -> List[str]:
+        """Encodings to try for data starting with raw, the detected one first"""
+        detected = self._detect_encoding(raw[:self.sniff_size])
+        return [detected] + [encoding for encoding in self.encodings if encoding != detected]
+    
     def extract_translatable_text(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract translatable text from TyranoBuilder files"""
         texts = []
         
         try:
-            encodings = ['utf-8', 'shift-jis', 'cp932']
-            content = None
+            use_mmap = os.path.getsize(file_path) >= MMAP_THRESHOLD
             
-            for encoding in encodings:
+            # Normally the detected encoding decodes the file; the others are a fallback
+            for encoding in self._get_encodings(file_path):
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
+                    if use_mmap and self._is_ascii_compatible(encoding):
+                        texts = self._extract_from_lines(self._iter_mapped_lines(file_path, encoding))
+                    else:
+                        # Stream lines instead of holding the whole script and its split copy
+                        with open(file_path, 'r', encoding=encoding) as f:
+                            texts = self._extract_from_lines(f)
                     break
                 except UnicodeDecodeError:
+                    texts = []
                     continue
             
-            if not content:
-                return texts
+        except Exception as e:
+            self.logger.error(f"Error processing TyranoBuilder file {file_path}: {e}")
+        
+        return texts
+    
+    def _is_ascii_compatible(self, encoding: str) -> bool:
+        """Whether newlines and ';' are single ASCII bytes in encoding (true for UTF-8 and Shift-JIS, not UTF-16)"""
+        try:
+            return '\n;'.encode(encoding) == b'\n;'
+        except LookupError:
+            return False
+    
+    def _iter_mapped_lines(self, file_path: str, encoding: str) -> Iterator[str]:
+        """Yield the lines of a memory-mapped script, decoding only lines that can hold text
+        
+        Blank and comment lines are yielded as '' so line numbers stay aligned.
+        """
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw_line in iter(mm.readline, b''):
+                stripped = raw_line.strip()
+                if not stripped or stripped.startswith(b';'):
+                    yield ''
+                else:
+                    yield raw_line.decode(encoding)
+    
+    def _extract_from_lines(self, lines: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """Extract translatable text from the lines of a TyranoBuilder script"""
+        texts = []
+        current_character = ""
+        
+        for line_num, line in enumerate(lines, 1):
+            original_line = line.strip()
             
-            line_num = 0
-            current_character = ""
+            if not original_line or original_line.startswith(';'):
+                continue
             
-            for line in content.split('\n'):
-                line_num += 1
-                original_line = line.strip()
-                
-                if not original_line or original_line.startswith(';'):
-                    continue
-                
-                # Character name detection
-                chara_match = re.match(r'#([^#\n]+)', original_line)
-                if chara_match:
-                    character_name = chara_match.group(1).strip()
-                    if self._is_translatable_text(character_name):
-                        texts.append((character_name, f"line_{line_num}", "character"))
-                        current_character = character_name
-                    continue
-                
-                # TyranoScript commands
-                if original_line.startswith('[') or original_line.startswith('@'):
-                    # Extract text from TyranoScript tags
-                    tag_texts = self._extract_from_tags(original_line, line_num)
-                    texts.extend(tag_texts)
-                    continue
-                
-                # Regular dialogue text (not starting with special characters)
-                if not original_line.startswith(('[', '@', '*', '&')):
-                    # Remove ruby text and other formatting
-                    clean_text = self._clean_dialogue_text(original_line)
-                    
-                    if self._is_translatable_text(clean_text):
-                        context = f"line_{line_num}"
-                        if current_character:
-                            context += f"_char_{current_character}"
-                        texts.append((clean_text, context, "dialogue"))
+            # Character name detection
+            chara_match = self.character_pattern.match(original_line)
+            if chara_match:
+                character_name = chara_match.group(1).strip()
+                if self._is_translatable_text(character_name):
+                    texts.append((character_name, f"line_{line_num}", "character"))
+                    current_character = character_name
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error processing TyranoBuilder file {file_path}: {e}")
+            # TyranoScript commands
+            if original_line.startswith('[') or original_line.startswith('@'):
+                # Extract text from TyranoScript tags
+                tag_texts = self._extract_from_tags(original_line, line_num)
+                texts.extend(tag_texts)
+                continue
+            
+            # Regular dialogue text (not starting with special characters)
+            if not original_line.startswith(('[', '@', '*', '&')):
+                # Remove ruby text and other formatting
+                clean_text = self._clean_dialogue_text(original_line)
+                
+                if self._is_translatable_text(clean_text):
+                    context = f"line_{line_num}"
+                    if current_character:
+                        context += f"_char_{current_character}"
+                    texts.append((clean_text, context, "dialogue"))
         
         return texts
     
@@ -136,38 +256,23 @@ class TyranoBuilderProcessor:
         """Extract text from TyranoScript tags"""
         texts = []
         
-        # Common TyranoScript tags that contain text
-        text_patterns = [
-            r'\[chara_new\s+.*?name="([^"]+)"',  # Character registration
-            r'\[bg\s+.*?storage="([^"]+)"',      # Background names
-            r'\[playse\s+.*?storage="([^"]+)"',  # Sound effect names
-            r'\[playbgm\s+.*?storage="([^"]+)"', # Music names
-            r'\[button\s+.*?text="([^"]+)"',     # Button text
-            r'\[link\s+.*?text="([^"]+)"',       # Link text
-            r'\[font\s+.*?\]([^[]+)',            # Font formatted text
-            r'text="([^"]+)"',                   # Generic text attribute
-            r'name="([^"]+)"',                   # Name attributes
-        ]
-        
-        for pattern in text_patterns:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
-                text = match.group(1).strip()
-                if self._is_translatable_text(text):
-                    texts.append((text, f"line_{line_num}_tag", "ui"))
+        for match in self.text_tag_pattern.finditer(line):
+            text = match.group(match.lastindex).strip()
+            if self._is_translatable_text(text):
+                texts.append((text, f"line_{line_num}_tag", "ui"))
         
         return texts
     
     def _clean_dialogue_text(self, text: str) -> str:
         """Clean dialogue text from TyranoBuilder formatting"""
         # Remove ruby text [ruby text=読み]漢字[/ruby]
-        text = re.sub(r'\[ruby[^\]]*\]([^\[]+)\[/ruby\]', r'\1', text)
+        text = self.ruby_pattern.sub(r'\1', text)
         
         # Remove other formatting tags
-        text = re.sub(r'\[/?[^\]]+\]', '', text)
+        text = self.tag_pattern.sub('', text)
         
         # Remove control characters
-        text = re.sub(r'[@#&*]', '', text)
+        text = self.control_pattern.sub('', text)
         
         return text.strip()
     
@@ -176,40 +281,38 @@ class TyranoBuilderProcessor:
         if not text or len(text.strip()) < 2:
             return False
         
-        # Check for Japanese characters
-        japanese_pattern = r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]'
-        if not re.search(japanese_pattern, text):
+        # Check for Japanese characters; ASCII-only strings (tag values, file names) are
+        # rejected from the string's cached ASCII flag without running the regex
+        if text.isascii() or not self.japanese_pattern.search(text):
             return False
         
         # Filter out file names and system strings
-        if text.lower().endswith(('.jpg', '.png', '.gif', '.wav', '.mp3', '.ogg')):
-            return False
-        
-        system_strings = [
-            'true', 'false', 'null', 'undefined',
-            'auto', 'skip', 'save', 'load', 'config'
-        ]
-        
-        if text.lower() in system_strings:
+        lowered = text.lower()
+        if lowered.endswith(MEDIA_EXTENSIONS) or lowered in SYSTEM_STRINGS:
             return False
         
         return True
     
     def create_translation_file(self, texts: List[Tuple[str, str, str]], output_path: str):
         """Create translation file for TyranoBuilder texts"""
-        translation_data = []
-        
-        for original, context, text_type in texts:
-            translation_data.append({
+        translation_data = [
+            {
                 'original': original,
                 'translation': '',
                 'context': context,
                 'type': text_type,
                 'notes': ''
-            })
+            }
+            for original, context, text_type in texts
+        ]
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(translation_data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            # orjson serializes straight to UTF-8 bytes
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(translation_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump(translation_data, f, ensure_ascii=False, indent=2)
         
         self.logger.info(f"Created TyranoBuilder translation file: {output_path}")
     
@@ -221,20 +324,22 @@ class TyranoBuilderProcessor:
                 translations = json.load(f)
             
             # Create translation dictionary
-            trans_dict = {}
-            for item in translations:
-                if item['translation'].strip():
-                    trans_dict[item['original']] = item['translation']
+            trans_dict = {
+                item['original']: item['translation']
+                for item in translations
+                if item['translation'].strip()
+            }
+            
+            # Read original file once; detection and decoding both work on these bytes
+            with open(original_file, 'rb') as f:
+                data = f.read()
             
-            # Read original file
-            encodings = ['utf-8', 'shift-jis', 'cp932']
             content = None
             used_encoding = 'utf-8'
             
-            for encoding in encodings:
+            for encoding in self._candidate_encodings(data):
                 try:
-                    with open(original_file, 'r', encoding=encoding) as f:
-                        content = f.read()
+                    content = data.decode(encoding)
                     used_encoding = encoding
                     break
                 except UnicodeDecodeError:
@@ -245,25 +350,84 @@ class TyranoBuilderProcessor:
             
             # Apply translations line by line to preserve formatting
             lines = content.split('\n')
-            translated_lines = []
+            replace_line = self._build_replacer(trans_dict)
             
-            for line in lines:
-                translated_line = line
-                
-                # Apply translations
-                for original, translation in trans_dict.items():
-                    # Use word boundary matching where possible
-                    if original in line:
-                        translated_line = translated_line.replace(original, translation)
-                
-                translated_lines.append(translated_line)
-            
-            # Write translated file
-            translated_content = '\n'.join(translated_lines)
-            with open(output_file, 'w', encoding=used_encoding) as f:
-                f.write(translated_content)
+            # Write translated lines as they are produced; the large buffer keeps disk writes big
+            # newline='' keeps the original line endings, which stay on the decoded lines
+            with open(output_file, 'w', encoding=used_encoding, newline='', buffering=WRITE_BUFFER_SIZE) as f:
+                for i, line in enumerate(lines):
+                    if i:
+                        f.write('\n')
+                    f.write(replace_line(line))
             
             self.logger.info(f"Applied TyranoBuilder translations to: {output_file}")
             
         except Exception as e:
             self.logger.error(f"Error applying TyranoBuilder translations: {e}")
+    
+    def _build_replacer(self, trans_dict: Dict[str, str]) -> Callable[[str], str]:
+        """Build a function that replaces every original in a line in a single scan
+        
+        Overlapping originals resolve to the leftmost, then longest, match.
+        """
+        trans_dict = {original: translation for original, translation in trans_dict.items() if original}
+        if not trans_dict:
+            return str
+        
+        if not AHOCORASICK_AVAILABLE:
+            return self._build_prefix_replacer(trans_dict)
+        
+        automaton = ahocorasick.Automaton()
+        for original, translation in trans_dict.items():
+            automaton.add_word(original, (len(original), translation))
+        automaton.make_automaton()
+        
+        def replace_line(line: str) -> str:
+            matches = sorted((end - length + 1, -length, translation)
+                             for end, (length, translation) in automaton.iter(line))
+            parts = []
+            pos = 0
+            for start, neg_length, translation in matches:
+                if start < pos:
+                    continue  # Overlaps a match already replaced
+                parts.append(line[pos:start])
+                parts.append(translation)
+                pos = start - neg_length
+            parts.append(line[pos:])
+            return ''.join(parts)
+        
+        return replace_line
+    
+    def _build_prefix_replacer(self, trans_dict: Dict[str, str]) -> Callable[[str], str]:
+        """Replacer used when pyahocorasick is not installed
+        
+        Only tries originals starting with the character at each position. Overlaps
+        resolve to the leftmost, then longest, match, as in the automaton replacer.
+        """
+        # Longest originals first so they win over their own prefixes
+        by_first = defaultdict(list)
+        for original in sorted(trans_dict, key=len, reverse=True):
+            by_first[original[0]].append(original)
+        
+        def replace_line(line: str) -> str:
+            # Most script lines (tags, labels) contain no original at all
+            if by_first.keys().isdisjoint(line):
+                return line
+            
+            parts = []
+            pos = 0
+            i = 0
+            while i < len(line):
+                for original in by_first.get(line[i], ()):
+                    if line.startswith(original, i):
+                        parts.append(line[pos:i])
+                        parts.append(trans_dict[original])
+                        i += len(original)
+                        pos = i
+                        break
+                else:
+                    i += 1
+            parts.append(line[pos:])
+            return ''.join(parts)
+        
+        return replace_line
@@ -7,18 +7,92 @@ Supports various Unity localization formats including JSON, CSV, and Unity Local
 import os
 import json
 import csv
+import codecs
 import xml.etree.ElementTree as ET
 import re
-from typing import Dict, List, Any, Tuple, Optional
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional, Iterable, Iterator, Callable
 from pathlib import Path
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# needs_translation reads files in chunks of this many characters, stopping at the first hit
+SCAN_CHUNK_SIZE = 64 << 10
+
+# JSON files at least this large are stream-parsed (when ijson is available)
+# instead of loaded whole
+JSON_STREAM_THRESHOLD = 16 << 20
+
+# Unity language codes for the GUI's language names and locale tags
+LANGUAGE_CODES = {
+    'English': 'en',
+    'en': 'en',
+    '简体中文': 'zh-CN',
+    'zh-CN': 'zh-CN',
+    '繁體中文': 'zh-TW',
+    'zh-TW': 'zh-TW',
+    '한국어': 'ko',
+    'ko-KR': 'ko',
+    'Русский': 'ru',
+    'ru-RU': 'ru',
+    'Español': 'es',
+    'es-ES': 'es',
+    'Français': 'fr',
+    'fr-FR': 'fr',
+    'Deutsch': 'de',
+    'de-DE': 'de',
+    'Italiano': 'it',
+    'it-IT': 'it',
+    'Português': 'pt',
+    'pt-BR': 'pt'
+}
+# Case-insensitive fallback, so 'ENGLISH' or 'EN' resolve like 'English'
+_LANGUAGE_CODES_FOLDED = {name.casefold(): code for name, code in LANGUAGE_CODES.items()}
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib parser handle (or report) non-strict input
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON with 2-space indentation"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Exotic types (e.g. big ints) fall back to the stdlib encoder
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 class UnityProcessor:
     """Processes Unity projects for translation"""
     
     def __init__(self):
-        # Patterns for Japanese text detection
-        self.japanese_pattern = re.compile(r'[ひらがなカタカナ漢字\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]+')
+        # Pattern for Japanese text detection; only used with search(), so one character is enough
+        self.japanese_pattern = re.compile(r'[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]')
+        # The same ranges as UTF-8 byte sequences, for sniffing without decoding
+        self.japanese_utf8_pattern = re.compile(
+            rb'\xe3[\x81-\x83][\x80-\xbf]'                  # U+3040-U+30FF
+            rb'|\xe4[\xb8-\xbf][\x80-\xbf]|[\xe5-\xe8][\x80-\xbf]{2}'  # U+4E00-U+8FFF
+            rb'|\xe9(?:[\x80-\xbd][\x80-\xbf]|\xbe[\x80-\xaf])'  # U+9000-U+9FAF
+        )
         
         # Common Unity localization file patterns
         self.localization_patterns = [
@@ -67,6 +141,25 @@ class UnityProcessor:
         self.unity_text_extensions = [
             '.json', '.csv', '.txt', '.xml', '.yml', '.yaml'
         ]
+        
+        # Matchers built once from the patterns above: one regex for all localization
+        # globs (tested against '/'-separated paths relative to Assets) and the set of
+        # directory names to prune
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        self.localization_regex = re.compile(
+            '|'.join(self._glob_to_regex(pattern) for pattern in self.localization_patterns), flags
+        )
+        self.exclude_dirs = frozenset(pattern.strip('*/') for pattern in self.exclude_patterns)
+    
+    def _glob_to_regex(self, pattern: str) -> str:
+        """Translate a glob where '**/' spans any number of directories and '*'/'?' stay within one"""
+        pieces = []
+        for piece in pattern.split('**/'):
+            pieces.append(''.join(
+                '[^/]*' if char == '*' else '[^/]' if char == '?' else re.escape(char)
+                for char in piece
+            ))
+        return '(?:' + '(?:.*/)?'.join(pieces) + ')'
     
     def detect_unity_project(self, directory: str) -> bool:
         """Detect if directory contains a Unity project"""
@@ -112,76 +205,129 @@ class UnityProcessor:
     
     def find_unity_text_files(self, directory: str) -> List[str]:
         """Find all text files that might contain translatable content"""
-        import glob
-        
         text_files = []
+        candidates = []  # Other text files, kept if a content sniff finds Japanese
         assets_dir = os.path.join(directory, 'Assets')
         
         if not os.path.exists(assets_dir):
             return []
         
-        # Search for localization files
-        for pattern in self.localization_patterns:
-            search_path = os.path.join(assets_dir, pattern.replace('**/', ''))
-            found_files = glob.glob(search_path, recursive=True)
-            
-            for file_path in found_files:
-                # Skip excluded directories
-                should_exclude = False
-                for exclude_pattern in self.exclude_patterns:
-                    if exclude_pattern.replace('**/', '') in file_path:
-                        should_exclude = True
-                        break
-                
-                if not should_exclude and file_path not in text_files:
-                    text_files.append(file_path)
-        
-        # Also search for any text files with Japanese content
-        for root, dirs, files in os.walk(assets_dir):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if not any(
-                exclude.replace('**/', '').replace('/', '') in d 
-                for exclude in self.exclude_patterns
-            )]
-            
-            for file in files:
-                if any(file.endswith(ext) for ext in self.unity_text_extensions):
-                    file_path = os.path.join(root, file)
-                    
-                    if file_path not in text_files and self.might_contain_japanese(file_path):
-                        text_files.append(file_path)
+        text_extensions = tuple(self.unity_text_extensions)
+        
+        # One walk serves both the localization patterns and the Japanese content check
+        for rel_path, entry in self._iter_asset_files(assets_dir):
+            # Localization files are always included
+            if self.localization_regex.fullmatch(rel_path):
+                text_files.append(entry.path)
+            # Also include any other text files with Japanese content
+            elif entry.name.endswith(text_extensions):
+                candidates.append(entry.path)
+        
+        # The sniffs are small blocking reads, so overlap them on a thread pool
+        if candidates:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self.might_contain_japanese, candidates, chunksize=64)
+                text_files.extend(path for path, has_japanese in zip(candidates, results) if has_japanese)
         
         return sorted(text_files)
     
+    def _iter_asset_files(self, assets_dir: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (relative '/'-separated path, entry) for files under assets_dir,
+        pruning excluded directories and reusing scandir's cached entry types"""
+        pending_dirs = [(assets_dir, '')]
+        while pending_dirs:
+            dir_path, rel_prefix = pending_dirs.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip excluded directories
+                        if entry.name not in self.exclude_dirs:
+                            pending_dirs.append((entry.path, f"{rel_prefix}{entry.name}/"))
+                    else:
+                        yield rel_prefix + entry.name, entry
+    
     def might_contain_japanese(self, file_path: str) -> bool:
         """Quick check if file might contain Japanese text"""
         try:
-            # Read first few KB to check for Japanese
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Read first few KB as raw bytes to check for Japanese
+            with open(file_path, 'rb') as f:
                 sample = f.read(4096)  # Read first 4KB
-                return bool(self.japanese_pattern.search(sample))
         except Exception:
-            try:
-                # Try with different encoding
-                with open(file_path, 'r', encoding='shift-jis') as f:
-                    sample = f.read(4096)
-                    return bool(self.japanese_pattern.search(sample))
-            except Exception:
-                return False
+            return False
+        
+        # Pure ASCII bytes can't hold Japanese in either encoding; no decode needed
+        if sample.isascii():
+            return False
+        
+        # UTF-8 Japanese is found straight in the bytes, with no decoded copy
+        if self.japanese_utf8_pattern.search(sample):
+            return True
+        
+        # Otherwise only a sample that isn't valid UTF-8 is worth decoding as Shift-JIS.
+        # Incremental decoders tolerate a character cut off at the end of the sample.
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample)
+            return False
+        except UnicodeDecodeError:
+            pass
+        
+        try:
+            return self.contains_japanese(codecs.getincrementaldecoder('shift-jis')().decode(sample))
+        except UnicodeDecodeError:
+            return False
+    
+    def contains_japanese(self, text: str) -> bool:
+        """Check if text contains any Japanese character"""
+        # ASCII-only text (most code and config files) is answered from the string's
+        # cached ASCII flag; only the rest goes through the regex scan
+        return not text.isascii() and self.japanese_pattern.search(text) is not None
     
     def needs_translation(self, file_path: str) -> bool:
         """Check if the file contains translatable Japanese text"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return bool(self.japanese_pattern.search(content))
+            return self._read_with_encodings(file_path, self._file_contains_japanese)
         except Exception:
+            return False
+    
+    def _file_contains_japanese(self, file_path: str, encoding: str) -> bool:
+        """Scan a file chunk by chunk, returning as soon as Japanese text is found"""
+        with open(file_path, 'r', encoding=encoding) as f:
+            while True:
+                chunk = f.read(SCAN_CHUNK_SIZE)
+                if not chunk:
+                    return False
+                if self.contains_japanese(chunk):
+                    return True
+    
+    def _get_encodings(self, file_path: str) -> Tuple[str, ...]:
+        """Encodings to try for a file, the detected one first"""
+        with open(file_path, 'rb') as f:
+            sample = f.read(4096)
+        
+        try:
+            # Incremental decoding tolerates a character cut off at the end of the sample
+            codecs.getincrementaldecoder('utf-8')().decode(sample)
+            return ('utf-8', 'shift-jis')
+        except UnicodeDecodeError:
+            # Not UTF-8 anywhere in the sample, so skip straight to the legacy encoding
+            return ('shift-jis', 'utf-8')
+    
+    def _read_with_encodings(self, file_path: str, reader: Callable[[str, str], Any]) -> Any:
+        """Call reader(file_path, encoding) with each candidate encoding until one succeeds,
+        raising the first error if none does"""
+        first_error = None
+        for encoding in self._get_encodings(file_path):
             try:
-                with open(file_path, 'r', encoding='shift-jis') as f:
-                    content = f.read()
-                return bool(self.japanese_pattern.search(content))
-            except Exception:
-                return False
+                return reader(file_path, encoding)
+            except Exception as e:
+                first_error = first_error or e
+        raise first_error
     
     def extract_translatable_text(self, file_path: str) -> List[Tuple[str, str, str]]:
         """
@@ -208,107 +354,165 @@ class UnityProcessor:
     
     def _extract_from_json(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract text from JSON files"""
+        encodings = self._get_encodings(file_path)
+        if (IJSON_AVAILABLE and encodings[0] == 'utf-8'
+                and os.path.getsize(file_path) >= JSON_STREAM_THRESHOLD):
+            # Stream parse events instead of building the whole document tree
+            with open(file_path, 'rb') as f:
+                return self._extract_from_json_events(ijson.parse(f))
+        
+        # Read once; a fallback encoding re-decodes the same bytes
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        first_error = None
+        for encoding in encodings:
+            try:
+                data = _load_json_bytes(raw) if encoding == 'utf-8' else json.loads(raw.decode(encoding))
+                break
+            except Exception as e:
+                first_error = first_error or e
+        else:
+            raise first_error
+        
         translatable_texts = []
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            def extract_recursive(obj, path=""):
-                if isinstance(obj, str):
-                    if self.japanese_pattern.search(obj):
-                        translatable_texts.append((obj, path, "json"))
-                elif isinstance(obj, dict):
-                    for key, value in obj.items():
-                        new_path = f"{path}.{key}" if path else key
-                        extract_recursive(value, new_path)
-                elif isinstance(obj, list):
-                    for i, item in enumerate(obj):
-                        new_path = f"{path}[{i}]"
-                        extract_recursive(item, new_path)
-            
-            extract_recursive(data)
-            
-        except Exception as e:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='shift-jis') as f:
-                    data = json.load(f)
-                # Repeat extraction with new data
-                # ... (same logic as above)
-            except Exception:
-                raise e
+        # Iterative depth-first walk; children are pushed reversed to keep document order
+        stack = [(data, "")]
+        while stack:
+            obj, path = stack.pop()
+            if isinstance(obj, str):
+                if self.japanese_pattern.search(obj):
+                    translatable_texts.append((obj, path, "json"))
+            elif isinstance(obj, dict):
+                stack.extend((value, f"{path}.{key}" if path else key)
+                             for key, value in reversed(list(obj.items())))
+            elif isinstance(obj, list):
+                stack.extend((obj[i], f"{path}[{i}]") for i in range(len(obj) - 1, -1, -1))
+        
+        return translatable_texts
+    
+    def _extract_from_json_events(self, events: Iterable[Tuple[str, str, Any]]) -> List[Tuple[str, str, str]]:
+        """Extract Japanese strings from ijson parse events, with the same key[index] paths
+        as the tree walk in _extract_from_json"""
+        translatable_texts = []
+        containers = []  # [path, key for maps / last index for arrays, is_array]
+        
+        def value_path():
+            if not containers:
+                return ""
+            container = containers[-1]
+            if container[2]:
+                container[1] += 1
+                return f"{container[0]}[{container[1]}]"
+            return f"{container[0]}.{container[1]}" if container[0] else container[1]
+        
+        for _, event, value in events:
+            if event == 'map_key':
+                containers[-1][1] = value
+            elif event == 'start_map':
+                containers.append([value_path(), None, False])
+            elif event == 'start_array':
+                containers.append([value_path(), -1, True])
+            elif event in ('end_map', 'end_array'):
+                containers.pop()
+            else:
+                path = value_path()
+                if event == 'string' and self.japanese_pattern.search(value):
+                    translatable_texts.append((value, path, "json"))
         
         return translatable_texts
     
     def _extract_from_csv(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract text from CSV files"""
+        return self._read_with_encodings(file_path, self._extract_csv_cells)
+    
+    def _extract_csv_cells(self, file_path: str, encoding: str) -> List[Tuple[str, str, str]]:
+        """Extract Japanese cells from a CSV file read with the given encoding"""
         translatable_texts = []
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', newline='') as f:
-                # Try to detect delimiter
-                sample = f.read(1024)
-                f.seek(0)
-                
-                if '\t' in sample:
-                    delimiter = '\t'
-                elif ';' in sample:
-                    delimiter = ';'
-                else:
-                    delimiter = ','
-                
-                reader = csv.reader(f, delimiter=delimiter)
-                
-                for row_num, row in enumerate(reader):
-                    for col_num, cell in enumerate(row):
-                        if cell and self.japanese_pattern.search(cell):
-                            context = f"row_{row_num}_col_{col_num}"
-                            translatable_texts.append((cell, context, "csv"))
-        
-        except Exception:
-            # Try with different encoding
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            # Detect the delimiter from a sample; the sniffer honours quoting, so a tab or
+            # semicolon inside a quoted field doesn't decide it
+            sample = f.read(1024)
+            f.seek(0)
+            
             try:
-                with open(file_path, 'r', encoding='shift-jis', newline='') as f:
-                    reader = csv.reader(f)
-                    for row_num, row in enumerate(reader):
-                        for col_num, cell in enumerate(row):
-                            if cell and self.japanese_pattern.search(cell):
-                                context = f"row_{row_num}_col_{col_num}"
-                                translatable_texts.append((cell, context, "csv"))
-            except Exception as e:
-                raise e
+                delimiter = csv.Sniffer().sniff(sample, delimiters=',\t;').delimiter
+            except csv.Error:
+                delimiter = ','
+            
+            try:
+                return self._extract_from_csv_frame(f, delimiter)
+            except Exception:
+                # pandas missing or the table is ragged; fall back to the csv module
+                f.seek(0)
+            
+            reader = csv.reader(f, delimiter=delimiter)
+            
+            for row_num, row in enumerate(reader):
+                for col_num, cell in enumerate(row):
+                    if cell and self.japanese_pattern.search(cell):
+                        context = f"row_{row_num}_col_{col_num}"
+                        translatable_texts.append((cell, context, "csv"))
         
         return translatable_texts
     
+    def _extract_from_csv_frame(self, f, delimiter: str) -> List[Tuple[str, str, str]]:
+        """Extract Japanese cells with pandas' C parser and a per-column regex mask"""
+        import numpy as np
+        import pandas as pd
+        
+        df = pd.read_csv(f, sep=delimiter, header=None, dtype=str, keep_default_na=False,
+                         skip_blank_lines=False, engine='c')
+        mask = df.apply(lambda col: col.str.contains(self.japanese_pattern, na=False))
+        values = df.values
+        
+        # argwhere yields positions in row-major order, matching the csv.reader walk
+        return [(values[row_num, col_num], f"row_{row_num}_col_{col_num}", "csv")
+                for row_num, col_num in np.argwhere(mask.values)]
+    
     def _extract_from_xml(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract text from XML files"""
         translatable_texts = []
         
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+        def check_element(entry):
+            element, element_path, _ = entry
+            entry[2] = True
             
-            def extract_from_element(element, path=""):
-                # Check element text
-                if element.text and element.text.strip():
-                    text = element.text.strip()
-                    if self.japanese_pattern.search(text):
-                        element_path = f"{path}/{element.tag}" if path else element.tag
-                        translatable_texts.append((text, element_path, "xml"))
-                
-                # Check attributes
-                for attr_name, attr_value in element.attrib.items():
-                    if attr_value and self.japanese_pattern.search(attr_value):
-                        attr_path = f"{path}/{element.tag}@{attr_name}" if path else f"{element.tag}@{attr_name}"
-                        translatable_texts.append((attr_value, attr_path, "xml"))
-                
-                # Recursively check children
-                for child in element:
-                    child_path = f"{path}/{element.tag}" if path else element.tag
-                    extract_from_element(child, child_path)
+            # Check element text
+            if element.text and element.text.strip():
+                text = element.text.strip()
+                if self.japanese_pattern.search(text):
+                    translatable_texts.append((text, element_path, "xml"))
             
-            extract_from_element(root)
+            # Check attributes
+            for attr_name, attr_value in element.attrib.items():
+                if attr_value and self.japanese_pattern.search(attr_value):
+                    translatable_texts.append((attr_value, f"{element_path}@{attr_name}", "xml"))
+        
+        try:
+            # Stream the document and drop each element once it has been examined.
+            # An element's text is complete when its first child starts or when it ends,
+            # so checking it at whichever comes first keeps document order.
+            stack = []  # [element, path, checked] for each open element
+            for event, element in ET.iterparse(file_path, events=('start', 'end')):
+                if event == 'start':
+                    if stack:
+                        parent = stack[-1]
+                        if not parent[2]:
+                            check_element(parent)
+                        element_path = f"{parent[1]}/{element.tag}"
+                    else:
+                        element_path = element.tag
+                    stack.append([element, element_path, False])
+                else:
+                    entry = stack.pop()
+                    if not entry[2]:
+                        check_element(entry)
+                    element.clear()
+                    if stack:
+                        stack[-1][0].remove(element)
             
         except Exception as e:
             raise e
@@ -317,31 +521,19 @@ class UnityProcessor:
     
     def _extract_from_text(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract text from plain text files"""
+        return self._read_with_encodings(file_path, self._extract_text_lines)
+    
+    def _extract_text_lines(self, file_path: str, encoding: str) -> List[Tuple[str, str, str]]:
+        """Extract Japanese lines, iterating the file lazily instead of reading all lines"""
         translatable_texts = []
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
+        with open(file_path, 'r', encoding=encoding) as f:
+            for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if line and self.japanese_pattern.search(line):
                     context = f"line_{line_num}"
                     translatable_texts.append((line, context, "text"))
         
-        except Exception:
-            try:
-                with open(file_path, 'r', encoding='shift-jis') as f:
-                    lines = f.readlines()
-                
-                for line_num, line in enumerate(lines, 1):
-                    line = line.strip()
-                    if line and self.japanese_pattern.search(line):
-                        context = f"line_{line_num}"
-                        translatable_texts.append((line, context, "text"))
-            except Exception as e:
-                raise e
-        
         return translatable_texts
     
     def create_translation_file(self, original_file: str, translations: Dict[str, str], 
@@ -389,51 +581,33 @@ class UnityProcessor:
     
     def _get_language_code(self, language: str) -> str:
         """Get Unity language code from language name"""
-        language_codes = {
-            'English': 'en',
-            'en': 'en',
-            '简体中文': 'zh-CN',
-            'zh-CN': 'zh-CN',
-            '繁體中文': 'zh-TW', 
-            'zh-TW': 'zh-TW',
-            '한국어': 'ko',
-            'ko-KR': 'ko',
-            'Русский': 'ru',
-            'ru-RU': 'ru',
-            'Español': 'es',
-            'es-ES': 'es',
-            'Français': 'fr',
-            'fr-FR': 'fr',
-            'Deutsch': 'de',
-            'de-DE': 'de',
-            'Italiano': 'it',
-            'it-IT': 'it',
-            'Português': 'pt',
-            'pt-BR': 'pt'
-        }
-        
-        return language_codes.get(language, language.lower().replace('-', '_'))
+        code = LANGUAGE_CODES.get(language) or _LANGUAGE_CODES_FOLDED.get(language.casefold())
+        return code or language.lower().replace('-', '_')
     
     def _create_json_translation(self, original_file: str, translation_file: str, 
                                translations: Dict[str, str]):
         """Create translated JSON file"""
-        with open(original_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        def apply_translations(obj):
-            if isinstance(obj, str):
-                return translations.get(obj, obj)
-            elif isinstance(obj, dict):
-                return {key: apply_translations(value) for key, value in obj.items()}
-            elif isinstance(obj, list):
-                return [apply_translations(item) for item in obj]
-            else:
-                return obj
-        
-        translated_data = apply_translations(data)
-        
-        with open(translation_file, 'w', encoding='utf-8') as f:
-            json.dump(translated_data, f, ensure_ascii=False, indent=2)
+        with open(original_file, 'rb') as f:
+            data = _load_json_bytes(f.read())
+        
+        # Translation keys always contain Japanese, so ASCII-only strings skip the lookup
+        if isinstance(data, str) and not data.isascii():
+            data = translations.get(data, data)
+        
+        # Translate strings in place with an explicit stack of containers
+        stack = [data] if isinstance(data, (dict, list)) else []
+        while stack:
+            obj = stack.pop()
+            items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+            for key, value in items:
+                if isinstance(value, str):
+                    if not value.isascii():
+                        obj[key] = translations.get(value, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        
+        with open(translation_file, 'wb') as f:
+            f.write(_dump_json_bytes(data))
     
     def _create_csv_translation(self, original_file: str, translation_file: str, 
                               translations: Dict[str, str]):
@@ -443,40 +617,31 @@ class UnityProcessor:
         with open(original_file, 'r', encoding='utf-8', newline='') as f:
             reader = csv.reader(f)
             for row in reader:
-                translated_row = []
-                for cell in row:
-                    translated_cell = translations.get(cell, cell)
-                    translated_row.append(translated_cell)
-                rows.append(translated_row)
+                # ASCII-only cells cannot be translation keys
+                rows.append([cell if cell.isascii() else translations.get(cell, cell) for cell in row])
         
         with open(translation_file, 'w', encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
-            for row in rows:
-                writer.writerow(row)
+            writer.writerows(rows)
     
     def _create_xml_translation(self, original_file: str, translation_file: str, 
                               translations: Dict[str, str]):
         """Create translated XML file"""
         tree = ET.parse(original_file)
-        root = tree.getroot()
         
-        def translate_element(element):
+        # ElementTree's iter() visits every element without Python-level recursion
+        for element in tree.iter():
             # Translate element text
             if element.text and element.text.strip():
                 text = element.text.strip()
-                if text in translations:
+                if not text.isascii() and text in translations:
                     element.text = translations[text]
-            
+        
             # Translate attributes
             for attr_name, attr_value in element.attrib.items():
-                if attr_value in translations:
+                if not attr_value.isascii() and attr_value in translations:
                     element.attrib[attr_name] = translations[attr_value]
-            
-            # Recursively translate children
-            for child in element:
-                translate_element(child)
         
-        translate_element(root)
         tree.write(translation_file, encoding='utf-8', xml_declaration=True)
     
     def _create_text_translation(self, original_file: str, translation_file: str, 
@@ -485,15 +650,21 @@ class UnityProcessor:
         with open(original_file, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
+        # Match lines and keys in one normal form, so keys that come back with stray
+        # whitespace or in decomposed (NFD) form still hit with a single lookup
+        normalized = {unicodedata.normalize('NFC', key).strip(): value for key, value in translations.items()}
+        
         translated_lines = []
         for line in lines:
             stripped_line = line.strip()
-            if stripped_line in translations:
-                # Preserve original indentation
-                indent = line[:len(line) - len(line.lstrip())]
-                translated_lines.append(indent + translations[stripped_line] + '\n')
-            else:
-                translated_lines.append(line)
+            if not stripped_line.isascii():
+                stripped_line = unicodedata.normalize('NFC', stripped_line)
+                if stripped_line in normalized:
+                    # Preserve original indentation
+                    indent = line[:len(line) - len(line.lstrip())]
+                    translated_lines.append(indent + normalized[stripped_line] + '\n')
+                    continue
+            translated_lines.append(line)
         
         with open(translation_file, 'w', encoding='utf-8') as f:
             f.writelines(translated_lines)
@@ -503,15 +674,15 @@ class UnityProcessor:
         try:
             translatable_texts = self.extract_translatable_text(file_path)
             
-            japanese_texts = [text for text, _, _ in translatable_texts 
-                            if self.japanese_pattern.search(text)]
+            # Every extractor already keeps only entries matching japanese_pattern
+            japanese_count = len(translatable_texts)
             
             return {
                 'total_text_entries': len(translatable_texts),
-                'japanese_text_entries': len(japanese_texts),
-                'needs_translation': len(japanese_texts) > 0,
+                'japanese_text_entries': japanese_count,
+                'needs_translation': japanese_count > 0,
                 'file_size': os.path.getsize(file_path),
-                'estimated_tokens': sum(len(text) // 4 for text, _, _ in japanese_texts),
+                'estimated_tokens': sum(len(text) for text, _, _ in translatable_texts) >> 2,
                 'file_type': os.path.splitext(file_path)[1]
             }
             
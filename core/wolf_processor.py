@@ -5,12 +5,63 @@ Handles translation for Wolf RPG Editor games (.txt files and .wolf archives)
 
 import os
 import re
+import codecs
 import struct
+import mmap
+import threading
 import zlib
-from typing import Dict, List, Tuple, Any, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any, Optional, Iterator
 import tempfile
 import shutil
 
+try:
+    # ISA-L's zlib-compatible inflate is several times faster than stdlib zlib on x86_64
+    from isal import isal_zlib
+    ISAL_AVAILABLE = True
+    _decompress = isal_zlib.decompress
+    _DECOMPRESS_ERRORS = (isal_zlib.error, zlib.error)
+except ImportError:
+    ISAL_AVAILABLE = False
+    _decompress = zlib.decompress
+    _DECOMPRESS_ERRORS = (zlib.error,)
+
+
+# Extraction results shared across processor instances (the estimator and the translator
+# each create their own), keyed on path, mtime and size so edited files are re-read
+EXTRACT_CACHE_SIZE = 256
+_extract_cache: Dict[tuple, List[Tuple[str, str, str]]] = {}
+_extract_cache_lock = threading.Lock()
+
+# Archives with at least this many entries are extracted on a thread pool
+PARALLEL_EXTRACT_MIN_ENTRIES = 8
+
+# Files and folders typically found next to a Wolf RPG Editor game
+WOLF_INDICATORS = (
+    'Game.exe',
+    'Game.dat',
+    'Config.exe',
+    'Data',
+    'BGM',
+    'Picture',
+    'Sound'
+)
+
+# Language codes used in translated file names
+LANGUAGE_CODES = {
+    'English': 'en',
+    'Russian': 'ru',
+    'Spanish': 'es',
+    'French': 'fr',
+    'German': 'de',
+    'Chinese': 'zh',
+    'Korean': 'ko'
+}
+
+# Hiragana, katakana and CJK ideographs, plus the iteration/abbreviation marks 々 and 〆
+JAPANESE_CHARS = '\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff\u3005\u3006'
+
 
 class WolfProcessor:
     """Processor for Wolf RPG Editor games"""
@@ -21,28 +72,40 @@ class WolfProcessor:
         # Common Wolf RPG Editor text patterns
         self.text_patterns = [
             # Message text
-            r'\\msg\[([^\]]+)\]',
-            r'\\m\[([^\]]+)\]',
+            r'\\msg\[([^\]\n]+)\]',
+            r'\\m\[([^\]\n]+)\]',
             
             # Choice text
-            r'\\choice\[([^\]]+)\]',
-            r'\\c\[([^\]]+)\]',
+            r'\\choice\[([^\]\n]+)\]',
+            r'\\c\[([^\]\n]+)\]',
             
             # Character names
-            r'\\name\[([^\]]+)\]',
-            r'\\n\[([^\]]+)\]',
+            r'\\name\[([^\]\n]+)\]',
+            r'\\n\[([^\]\n]+)\]',
             
             # Description text
-            r'\\desc\[([^\]]+)\]',
-            r'\\d\[([^\]]+)\]',
+            r'\\desc\[([^\]\n]+)\]',
+            r'\\d\[([^\]\n]+)\]',
             
             # Direct Japanese text (enclosed in quotes)
-            r'"([^"]*[ひらがなカタカナ漢字々〆ヵヶ一-龯][^"]*)"',
-            r"'([^']*[ひらがなカタカナ漢字々〆ヵヶ一-龯][^']*)'",
+            rf'"([^"\n]*[{JAPANESE_CHARS}][^"\n]*)"',
+            rf"'([^'\n]*[{JAPANESE_CHARS}][^'\n]*)'",
             
             # Text without quotes but with Japanese characters
-            r'([ひらがなカタカナ漢字々〆ヵヶ一-龯][^\n\r\t,;:{}()[\]]*)',
+            rf'([{JAPANESE_CHARS}][^\n\r\t,;:{{}}()[\]]*)',
         ]
+        # All patterns fused into one alternation (one capture group each, so the
+        # matched text is match.group(match.lastindex)); earlier patterns win ties.
+        # None of them can cross a newline, so whole files are scanned in one pass.
+        self.text_pattern = re.compile('|'.join(f'(?:{pattern})' for pattern in self.text_patterns))
+        
+        # Pattern for Japanese text detection, compiled once instead of per call
+        self.japanese_pattern = re.compile(f'[{JAPANESE_CHARS}]')
+        # The same characters as UTF-8 byte sequences, for sniffing without decoding
+        self.japanese_utf8_pattern = re.compile(
+            rb'\xe3(?:\x80[\x85\x86]|[\x81-\x83][\x80-\xbf])'  # 々〆, U+3040-U+30FF
+            rb'|\xe4[\xb8-\xbf][\x80-\xbf]|[\xe5-\xe9][\x80-\xbf]{2}'  # U+4E00-U+9FFF
+        )
         
         # Wolf archive magic numbers
         self.wolf_magic = b'DX\x00\x00'
@@ -51,18 +114,8 @@ class WolfProcessor:
         """Detect if directory contains a Wolf RPG Editor project"""
         
         # Check for Wolf RPG Editor indicators
-        wolf_indicators = [
-            'Game.exe',
-            'Game.dat',
-            'Config.exe',
-            'Data',
-            'BGM',
-            'Picture',
-            'Sound'
-        ]
-        
         indicator_count = 0
-        for indicator in wolf_indicators:
+        for indicator in WOLF_INDICATORS:
             if os.path.exists(os.path.join(directory, indicator)):
                 indicator_count += 1
         
@@ -70,11 +123,10 @@ class WolfProcessor:
         if indicator_count >= 3:
             return True
         
-        # Check for .wolf files
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith('.wolf'):
-                    return True
+        # Check for .wolf files, stopping at the first one
+        for entry in self._iter_files(directory):
+            if entry.name.lower().endswith('.wolf'):
+                return True
         
         # Check for characteristic text files
         data_dir = os.path.join(directory, 'Data')
@@ -91,57 +143,94 @@ class WolfProcessor:
         """Find all Wolf RPG Editor text files"""
         
         text_files = []
+        candidates = []  # .txt files, kept if a content sniff finds Japanese
         
-        # Common Wolf RPG Editor directories
-        search_dirs = [
-            directory,
-            os.path.join(directory, 'Data'),
-            os.path.join(directory, 'Text'),
-            os.path.join(directory, 'Script'),
-            os.path.join(directory, 'Event'),
-        ]
+        # The project root walk already covers the usual Data/Text/Script/Event
+        # directories, so each file is visited (and reported) once
+        for entry in self._iter_files(directory):
+            name = entry.name.lower()
+            
+            if name.endswith('.txt'):
+                candidates.append(entry.path)
+            
+            elif name.endswith('.wolf'):
+                text_files.append(entry.path)
         
-        for search_dir in search_dirs:
-            if not os.path.exists(search_dir):
-                continue
-                
-            for root, dirs, files in os.walk(search_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    
-                    if file.lower().endswith('.txt'):
-                        if self.might_contain_japanese(file_path):
-                            text_files.append(file_path)
-                    
-                    elif file.lower().endswith('.wolf'):
-                        text_files.append(file_path)
+        # The sniffs are small blocking reads, so overlap them on a thread pool
+        if candidates:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self.might_contain_japanese, candidates, chunksize=8)
+                text_files.extend(path for path, has_japanese in zip(candidates, results) if has_japanese)
         
-        return text_files
+        return sorted(text_files)
+    
+    def _iter_files(self, directory: str) -> Iterator[os.DirEntry]:
+        """Yield file entries under directory, reusing scandir's cached entry types"""
+        pending_dirs = [directory]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    else:
+                        yield entry
     
     def might_contain_japanese(self, file_path: str) -> bool:
         """Check if file might contain Japanese text"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1024)  # Read first 1KB
-                
-            # Check for Japanese characters
-            japanese_pattern = r'[ひらがなカタカナ漢字々〆ヵヶ一-龯]'
-            return bool(re.search(japanese_pattern, content))
-            
+            with open(file_path, 'rb') as f:
+                sample = f.read(1024)  # Read first 1KB
         except Exception:
-            try:
-                # Try Shift-JIS encoding
-                with open(file_path, 'r', encoding='shift_jis', errors='ignore') as f:
-                    content = f.read(1024)
-                    
-                japanese_pattern = r'[ひらがなカタカナ漢字々〆ヵヶ一-龯]'
-                return bool(re.search(japanese_pattern, content))
-            except Exception:
-                return False
+            return False
+        
+        # Pure ASCII bytes can't hold Japanese in either encoding (English-only configs)
+        if sample.isascii():
+            return False
+        
+        # UTF-8 Japanese is found straight in the bytes, with no decoded copy
+        if self.japanese_utf8_pattern.search(sample):
+            return True
+        
+        # Otherwise only a sample that isn't valid UTF-8 is worth decoding as Shift-JIS.
+        # Incremental decoding tolerates a character cut off at the end of the sample.
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample)
+            return False
+        except UnicodeDecodeError:
+            pass
+        
+        # Check for Japanese characters
+        return bool(self.japanese_pattern.search(sample.decode('shift_jis', errors='ignore')))
     
     def extract_translatable_text(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract translatable text from Wolf RPG Editor files"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._extract_uncached(file_path)
+        
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        with _extract_cache_lock:
+            cached = _extract_cache.get(key)
+        if cached is not None:
+            return list(cached)
         
+        texts = self._extract_uncached(file_path)
+        with _extract_cache_lock:
+            _extract_cache[key] = texts
+            while len(_extract_cache) > EXTRACT_CACHE_SIZE:
+                del _extract_cache[next(iter(_extract_cache))]
+        
+        # Callers get their own list so they can't alter the cached one
+        return list(texts)
+    
+    def _extract_uncached(self, file_path: str) -> List[Tuple[str, str, str]]:
         if file_path.lower().endswith('.wolf'):
             return self._extract_from_wolf_archive(file_path)
         else:
@@ -152,32 +241,45 @@ class WolfProcessor:
         
         texts = []
         
-        try:
-            # Try UTF-8 first
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Fallback to Shift-JIS
-            with open(file_path, 'r', encoding='shift_jis', errors='ignore') as f:
-                content = f.read()
+        content = self._read_text(file_path)
         
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
+        # One scan of the whole file; line numbers advance by counting the newlines
+        # skipped since the previous match, so no per-line strings are built
+        line_num = 1
+        counted_to = 0
+        for found in self.text_pattern.finditer(content):
+            start = found.start()
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
             
-            # Try each pattern
-            for pattern in self.text_patterns:
-                matches = re.findall(pattern, line)
-                for match in matches:
-                    if self._is_japanese_text(match):
-                        key = f"line_{line_num}_{len(texts)}"
-                        texts.append((key, match, file_path))
+            match = found.group(found.lastindex)
+            if match[-1:].isspace():
+                # Bare text can run to the end of the line; drop the trailing
+                # whitespace that stripping the line used to remove
+                match_end = found.end(found.lastindex)
+                line_end = content.find('\n', match_end)
+                if not content[match_end:line_end if line_end != -1 else len(content)].strip():
+                    match = match.rstrip()
+            
+            if self._is_japanese_text(match):
+                key = f"line_{line_num}_{len(texts)}"
+                texts.append((key, match, file_path))
         
         return texts
     
+    def _read_text(self, file_path: str) -> str:
+        """Read a file once and decode it as UTF-8, falling back to Shift-JIS"""
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        try:
+            content = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            content = raw.decode('shift_jis', errors='ignore')
+        
+        # Match text-mode reads, which translate \r\n and \r to \n
+        return content.replace('\r\n', '\n').replace('\r', '\n')
+    
     def _extract_from_wolf_archive(self, file_path: str) -> List[Tuple[str, str, str]]:
         """Extract text from .wolf archive files"""
         
@@ -217,45 +319,48 @@ class WolfProcessor:
                 if magic != self.wolf_magic:
                     return False
                 
-                # Read archive header
-                file_count = struct.unpack('<I', f.read(4))[0]
-                
-                # Read file entries
-                files = []
-                for i in range(file_count):
-                    # Read filename length
-                    name_len = struct.unpack('<I', f.read(4))[0]
-                    
-                    # Read filename
-                    filename = f.read(name_len).decode('shift_jis', errors='ignore')
-                    
-                    # Read file size and offset
-                    file_size = struct.unpack('<I', f.read(4))[0]
-                    file_offset = struct.unpack('<I', f.read(4))[0]
-                    
-                    files.append({
-                        'name': filename,
-                        'size': file_size,
-                        'offset': file_offset
-                    })
-                
-                # Extract files
-                for file_info in files:
-                    f.seek(file_info['offset'])
-                    file_data = f.read(file_info['size'])
+                # Map the archive once; the file table is parsed straight out of the
+                # mapping and entries are sliced from it instead of a seek + read each
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Read archive header
+                    file_count, = struct.unpack_from('<I', mapped, 4)
                     
-                    # Try to decompress if it's compressed
-                    try:
-                        file_data = zlib.decompress(file_data)
-                    except zlib.error:
-                        pass  # Not compressed
+                    # Read file entries: name length, name, size, offset
+                    files = []
+                    position = 8
+                    for i in range(file_count):
+                        name_len, = struct.unpack_from('<I', mapped, position)
+                        name_start = position + 4
+                        filename = mapped[name_start:name_start + name_len].decode('shift_jis', errors='ignore')
+                        file_size, file_offset = struct.unpack_from('<II', mapped, name_start + name_len)
+                        position = name_start + name_len + 8
+                        
+                        files.append({
+                            'name': filename,
+                            'size': file_size,
+                            'offset': file_offset
+                        })
                     
-                    # Save file
-                    output_path = os.path.join(output_dir, file_info['name'])
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                    # Create each output directory once, up front, so the writers never race
+                    made_dirs = set()
+                    entries = []  # (offset, size, output path), in offset order for sequential reads
+                    for file_info in sorted(files, key=lambda info: info['offset']):
+                        output_path = os.path.join(output_dir, file_info['name'])
+                        entry_dir = os.path.dirname(output_path)
+                        if entry_dir not in made_dirs:
+                            os.makedirs(entry_dir, exist_ok=True)
+                            made_dirs.add(entry_dir)
+                        entries.append((file_info['offset'], file_info['size'], output_path))
                     
-                    with open(output_path, 'wb') as out_f:
-                        out_f.write(file_data)
+                    # Entries are independent and inflate releases the GIL, so bigger
+                    # archives are extracted on a thread pool sharing the one mapping
+                    if len(entries) < PARALLEL_EXTRACT_MIN_ENTRIES:
+                        for entry in entries:
+                            self._extract_archive_entry(mapped, *entry)
+                    else:
+                        workers = min(32, os.cpu_count() or 1)
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            list(executor.map(lambda entry: self._extract_archive_entry(mapped, *entry), entries))
                 
                 return True
                 
@@ -263,13 +368,34 @@ class WolfProcessor:
             print(f"Error extracting Wolf archive: {e}")
             return False
     
+    def _extract_archive_entry(self, mapped: mmap.mmap, offset: int, size: int, output_path: str):
+        """Decompress (if needed) and save one archive entry"""
+        with memoryview(mapped)[offset:offset + size] as file_data:
+            # Only entries with a valid zlib header are worth trying to
+            # decompress; stored entries skip the raise-and-catch
+            if self._has_zlib_header(file_data):
+                try:
+                    file_data = _decompress(file_data)
+                except _DECOMPRESS_ERRORS:
+                    pass  # Not compressed after all
+            
+            with open(output_path, 'wb') as out_f:
+                out_f.write(file_data)
+    
+    def _has_zlib_header(self, data) -> bool:
+        """Check for a zlib stream header: deflate method with a valid FCHECK checksum"""
+        return len(data) >= 2 and (data[0] & 0x0F) == 8 and ((data[0] << 8) | data[1]) % 31 == 0
+    
     def _is_japanese_text(self, text: str) -> bool:
         """Check if text contains Japanese characters"""
         if not text or len(text.strip()) < 2:
             return False
         
-        japanese_pattern = r'[ひらがなカタカナ漢字々〆ヵヶ一-龯]'
-        return bool(re.search(japanese_pattern, text))
+        # ASCII-only matches are answered from the string's cached ASCII flag
+        if text.isascii():
+            return False
+        
+        return self.japanese_pattern.search(text) is not None
     
     def create_translation_file(self, original_file: str, translations: Dict[str, str], 
                               output_dir: str, target_language: str):
@@ -293,29 +419,22 @@ class WolfProcessor:
         
         try:
             # Read original file
-            try:
-                with open(original_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                with open(original_file, 'r', encoding='shift_jis', errors='ignore') as f:
-                    content = f.read()
+            content = self._read_text(original_file)
             
-            # Apply translations
-            translated_content = content
-            for key, translation in translations.items():
-                # Find the original text and replace it
-                # This is a simplified approach
-                lines = translated_content.split('\n')
-                for i, line in enumerate(lines):
-                    for pattern in self.text_patterns:
-                        if re.search(pattern, line):
-                            # Replace Japanese text with translation
-                            for original_key, original_text, _ in self.extract_translatable_text(original_file):
-                                if original_key == key and original_text in line:
-                                    lines[i] = line.replace(original_text, translation)
-                                    break
-                
-                translated_content = '\n'.join(lines)
+            # Extract once and group the translations by line. Keys are
+            # line_<number>_<index>, numbered over the same '\n' split as below.
+            line_replacements = defaultdict(dict)
+            for key, original_text, _ in self.extract_translatable_text(original_file):
+                if key in translations:
+                    line_index = int(key.split('_')[1]) - 1
+                    line_replacements[line_index].setdefault(original_text, translations[key])
+            
+            lines = content.split('\n')
+            for line_index, replacements in line_replacements.items():
+                if line_index < len(lines):
+                    lines[line_index] = self._replace_once(lines[line_index], replacements)
+            
+            translated_content = '\n'.join(lines)
             
             # Save translated file
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -324,18 +443,20 @@ class WolfProcessor:
         except Exception as e:
             print(f"Error creating Wolf translation file: {e}")
     
+    def _replace_once(self, line: str, replacements: Dict[str, str]) -> str:
+        """Replace every original in a single pass, so text that several patterns
+        matched (or that a translation contains) is never translated twice"""
+        if len(replacements) == 1:
+            (original_text, translation), = replacements.items()
+            return line.replace(original_text, translation)
+        
+        # Longest originals first so a shorter match can't break up a longer one
+        alternation = '|'.join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+        return re.sub(alternation, lambda match: replacements[match.group(0)], line)
+    
     def _get_language_code(self, language: str) -> str:
         """Get language code for file naming"""
-        language_codes = {
-            'English': 'en',
-            'Russian': 'ru',
-            'Spanish': 'es',
-            'French': 'fr',
-            'German': 'de',
-            'Chinese': 'zh',
-            'Korean': 'ko'
-        }
-        return language_codes.get(language, 'en')
+        return LANGUAGE_CODES.get(language, 'en')
     
     def get_file_stats(self, file_path: str) -> Dict[str, Any]:
         """Get statistics for a Wolf RPG Editor file"""
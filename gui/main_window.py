@@ -7,20 +7,220 @@ import os
 import json
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QTabWidget, QLabel, QLineEdit, QPushButton, 
-                             QTextEdit, QTextBrowser, QFileDialog, QProgressBar, QSpinBox,
-                             QComboBox, QCheckBox, QGroupBox, QGridLayout,
+                             QTextEdit, QPlainTextEdit, QTextBrowser, QFileDialog, QProgressBar, QSpinBox,
+                             QComboBox, QCheckBox, QGroupBox, QGridLayout, QFormLayout,
                              QMessageBox, QScrollArea, QFrame, QDoubleSpinBox,
                              QInputDialog, QDialog, QApplication, QDesktopWidget, QListWidget)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+from PyQt5.QtGui import QFont, QIcon, QPixmap, QStandardItemModel, QStandardItem
 
 import os
 import time
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from core.translator import TranslationManager
 from core.config import ConfigManager
 from core.gui_config import GUIConfigManager
 
+# Project types checked by MainWindow.scan_project_type, in priority order
+# (light novel files come first since they could be mistaken for other formats)
+PROJECT_PROBES = (
+    'lightnovel', 'rpg_maker', 'renpy', 'unity', 'wolf', 'kirikiri', 'nscripter',
+    'livemaker', 'tyranobuilder', 'srpg_studio', 'lune', 'regex',
+)
+
+# Project type label text and stylesheet for each detection result
+DETECT_RESULTS = {
+    'lightnovel': ("✅ Light Novel project detected", "color: #8E24AA; font-weight: bold;"),
+    'rpg_maker': ("✅ RPG Maker project detected", "color: #2196F3; font-weight: bold;"),
+    'renpy': ("✅ Ren'Py project detected", "color: #4CAF50; font-weight: bold;"),
+    'unity': ("✅ Unity project detected", "color: #9C27B0; font-weight: bold;"),
+    'wolf': ("✅ Wolf RPG Editor project detected", "color: #FF5722; font-weight: bold;"),
+    'kirikiri': ("✅ KiriKiri project detected", "color: #3F51B5; font-weight: bold;"),
+    'nscripter': ("✅ NScripter project detected", "color: #009688; font-weight: bold;"),
+    'livemaker': ("✅ Live Maker project detected", "color: #E91E63; font-weight: bold;"),
+    'tyranobuilder': ("✅ TyranoBuilder project detected", "color: #9C27B0; font-weight: bold;"),
+    'srpg_studio': ("✅ SRPG Studio project detected", "color: #607D8B; font-weight: bold;"),
+    'lune': ("✅ Lune project detected", "color: #FF9800; font-weight: bold;"),
+    'regex': ("✅ Regex project detected", "color: #CDDC39; font-weight: bold;"),
+    'error': ("⚠️ Error detecting project type", "color: #f44336; font-weight: bold;"),
+    None: ("⚠️ No supported project detected", "color: #FF9800; font-weight: bold;"),
+}
+
+# Name prefixes of RPG Maker MV/MZ data files (Map001.json, CommonEvents.json, ...)
+RPG_MAKER_DATA_PREFIXES = ('Map', 'CommonEvents', 'System', 'Actors', 'Classes')
+
+# Button styles for the whole window, matched by object name
+GLOBAL_QSS = """
+    QPushButton#estimate {
+        background-color: #2196F3;
+        color: white;
+        font-weight: bold;
+        padding: 8px;
+        border-radius: 4px;
+    }
+    QPushButton#estimate:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#estimateProject {
+        background-color: #2196F3;
+        color: white;
+        font-weight: bold;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#estimateProject:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#start {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#start:hover {
+        background-color: #45a049;
+    }
+    QPushButton#resetTabs, QPushButton#installDeps {
+        background-color: #FF9800;
+        color: white;
+        padding: 8px;
+    }
+    QPushButton#recheckDeps, QPushButton#copyCommands {
+        background-color: #2196F3;
+        color: white;
+        padding: 8px;
+    }
+    QPushButton#applyTabs, QPushButton#lnTranslate, QPushButton#downloadModel {
+        background-color: #4CAF50;
+        color: white;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton#lnEstimate, QPushButton#retranscribe {
+        background-color: #FF9800;
+        color: white;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton#generateText {
+        background-color: #FF5722;
+        color: white;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton#transcribe {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+    }
+    QPushButton#generateCharacter {
+        background-color: #9C27B0;
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+    }
+    QPushButton#rpgRecommended, QPushButton#rpgAll, QPushButton#rpgDialogueOnly {
+        color: white;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPushButton#rpgRecommended {
+        background-color: #4CAF50;
+    }
+    QPushButton#rpgAll {
+        background-color: #FF9800;
+    }
+    QPushButton#rpgDialogueOnly {
+        background-color: #2196F3;
+    }
+    QPushButton#hideDeps {
+        background-color: #ccc;
+        border: none;
+        border-radius: 12px;
+    }
+    QPushButton#github, QPushButton#kofi, QPushButton#original {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#github {
+        background-color: #28a745;
+    }
+    QPushButton#github:hover {
+        background-color: #218838;
+    }
+    QPushButton#kofi {
+        background-color: #ff5722;
+    }
+    QPushButton#kofi:hover {
+        background-color: #e64a19;
+    }
+    QPushButton#original {
+        background-color: #6f42c1;
+    }
+    QPushButton#original:hover {
+        background-color: #5a359a;
+    }
+"""
+
+# Detection results keyed by the mtimes of the directory and the subdirectories the
+# probes look in, so reselecting a folder doesn't rescan it
+DETECT_CACHE_SIZE = 32
+DETECT_WATCHED_SUBDIRS = (
+    'Assets', 'ProjectSettings',               # Unity
+    os.path.join('www', 'data'), 'data',       # RPG Maker MV / MZ, SRPG Studio
+    'Data',                                    # Wolf RPG Editor
+    'game',                                    # Ren'Py
+    os.path.join('data', 'scenario'),          # TyranoBuilder
+)
+_detect_cache = {}
+_detect_cache_lock = threading.Lock()
+
+# Processors used for project detection, created on the first directory browse
+_PROCESSORS = None
+_processors_lock = threading.Lock()
+
+
+def _get_processors():
+    """Return the shared processor instances used by project detection"""
+    global _PROCESSORS
+    with _processors_lock:
+        if _PROCESSORS is None:
+            from core.renpy_processor import RenpyProcessor
+            from core.unity_processor import UnityProcessor
+            from core.wolf_processor import WolfProcessor
+            from core.kirikiri_processor import KiriKiriProcessor
+            from core.nscripter_processor import NScripterProcessor
+            from core.livemaker_processor import LiveMakerProcessor
+            from core.tyranobuilder_processor import TyranoBuilderProcessor
+            from core.srpg_studio_processor import SRPGStudioProcessor
+            from core.lune_processor import LuneProcessor
+            from core.regex_processor import RegexProcessor
+            from core.lightnovel_processor import LightNovelProcessor
+            
+            _PROCESSORS = {
+                'renpy': RenpyProcessor(),
+                'unity': UnityProcessor(),
+                'wolf': WolfProcessor(),
+                'kirikiri': KiriKiriProcessor(),
+                'nscripter': NScripterProcessor(),
+                'livemaker': LiveMakerProcessor(),
+                'tyranobuilder': TyranoBuilderProcessor(),
+                'srpg_studio': SRPGStudioProcessor(),
+                'lune': LuneProcessor(),
+                'regex': RegexProcessor(),
+                'lightnovel': LightNovelProcessor(),
+            }
+        return _PROCESSORS
+
+
 # Thread classes for background operations
 class SegmentRetranscriptionThread(QThread):
     """Thread for re-transcribing specific audio segments"""
@@ -156,9 +356,63 @@ from localization.language_manager import LanguageManager
 from utils.project_estimator import ProjectEstimator
 
 
+class ProjectDetectionThread(QThread):
+    """Thread for detecting the project type of a directory"""
+    detected = pyqtSignal(str, object)
+    
+    def __init__(self, scan, directory, parent=None):
+        super().__init__(parent)
+        self.scan = scan
+        self.directory = directory
+    
+    def run(self):
+        try:
+            project_type = self.scan(self.directory)
+        except Exception as e:
+            print(f"Error detecting project type: {e}")
+            project_type = 'error'
+        self.detected.emit(self.directory, project_type)
+
+
+class _PlaceholderTab:
+    """Stands in for the tab widget so a tab setup function replaces a placeholder tab"""
+    
+    def __init__(self, tab_widget, placeholder):
+        self.tab_widget = tab_widget
+        self.placeholder = placeholder
+    
+    def addTab(self, widget, title):
+        index = self.tab_widget.indexOf(self.placeholder)
+        # Swapping the current tab would otherwise report intermediate selections
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        self.placeholder.deleteLater()
+        return index
+
+
+class LazyComboBox(QComboBox):
+    """Combo box that fills in its items the first time the popup is opened"""
+    
+    def __init__(self, populate, parent=None):
+        super().__init__(parent)
+        self._populate = populate
+    
+    def showPopup(self):
+        if self._populate is not None:
+            populate, self._populate = self._populate, None
+            populate()
+        super().showPopup()
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Echo mode of a secret field, indexed by whether it is shown
+    _ECHO_MODES = (QLineEdit.Password, QLineEdit.Normal)
+    
     def __init__(self):
         super().__init__()
         
@@ -170,7 +424,17 @@ class MainWindow(QMainWindow):
         self.gui_config_manager = GUIConfigManager()
         self.language_manager = LanguageManager()
         self.translation_manager = None
+        
+        # Log messages are buffered and appended to the log display in batches
+        # (bounded like the display, since the log tab may not be built yet)
+        self._log_buf = deque(maxlen=10000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         self.setup_ui()
+        self.setStyleSheet(GLOBAL_QSS)
         self.load_config()
     
     def format_duration(self, seconds):
@@ -484,22 +748,28 @@ class MainWindow(QMainWindow):
         # Tab configuration - defines all available tabs
         self.tab_configs = {
             'config': {'name': '⚙️ Config', 'setup_func': self.setup_config_tab, 'default_visible': True},
-            'translation': {'name': '🌐 Translation', 'setup_func': self.setup_translation_tab, 'default_visible': True},
-            'lightnovel': {'name': '📚 Light Novel', 'setup_func': self.setup_lightnovel_tab, 'default_visible': True},
-            'rpg_editor': {'name': '✏️ RPG Maker Editor', 'setup_func': self.setup_rpg_editor_tab, 'default_visible': True},
+            'translation': {'name': '🌐 Translation', 'setup_func': self.setup_translation_tab, 'default_visible': True, 'lazy': True},
+            'lightnovel': {'name': '📚 Light Novel', 'setup_func': self.setup_lightnovel_tab, 'default_visible': True, 'lazy': True},
+            'rpg_editor': {'name': '✏️ RPG Maker Editor', 'setup_func': self.setup_rpg_editor_tab, 'default_visible': True, 'lazy': True},
             'audio': {'name': '🎵 Audio & Subtitles', 'setup_func': self.setup_audio_tab, 'default_visible': False},
             'character': {'name': '👥 Character Generator', 'setup_func': self.setup_character_tab, 'default_visible': False},
             'novel': {'name': '📝 Novel Writing', 'setup_func': self.setup_novel_writing_tab, 'default_visible': False},
             'local': {'name': '🖥️ Local Models', 'setup_func': self.setup_local_models_tab, 'default_visible': False},
             'cloud': {'name': '☁️ Cloud AI', 'setup_func': self.setup_cloud_tab, 'default_visible': False},
-            'providers': {'name': '🔄 Providers', 'setup_func': self.setup_providers_tab, 'default_visible': True},
+            'providers': {'name': '🔄 Providers', 'setup_func': self.setup_providers_tab, 'default_visible': True, 'lazy': True},
             'advanced': {'name': '🔧 Advanced', 'setup_func': self.setup_advanced_tab, 'default_visible': False},
-            'settings': {'name': '🎛️ Tab Settings', 'setup_func': self.setup_tab_settings_tab, 'default_visible': True},
-            'documentation': {'name': '📖 Documentation', 'setup_func': self.setup_documentation_tab, 'default_visible': True},
-            'about': {'name': 'ℹ️ About', 'setup_func': self.setup_about_tab, 'default_visible': True},
-            'log': {'name': '📋 Log', 'setup_func': self.setup_log_tab, 'default_visible': True}
+            'settings': {'name': '🎛️ Tab Settings', 'setup_func': self.setup_tab_settings_tab, 'default_visible': True, 'lazy': True},
+            'documentation': {'name': '📖 Documentation', 'setup_func': self.setup_documentation_tab, 'default_visible': True, 'lazy': True},
+            'about': {'name': 'ℹ️ About', 'setup_func': self.setup_about_tab, 'default_visible': True, 'lazy': True},
+            'log': {'name': '📋 Log', 'setup_func': self.setup_log_tab, 'default_visible': True, 'lazy': True}
         }
         
+        # Tabs marked 'lazy' only depend on their own widgets, so they are built the
+        # first time they are selected; the others are used across tabs and built up front
+        self._tab_builders = {}
+        self._tab_ids = []
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
         # Create tabs
         self.create_tabs()
         
@@ -515,6 +785,8 @@ class MainWindow(QMainWindow):
         try:
             # Clear existing tabs
             self.tab_widget.clear()
+            self._tab_builders.clear()
+            self._tab_ids = []
             
             # Load tab visibility settings
             visible_tabs = self.load_tab_visibility_settings()
@@ -523,11 +795,23 @@ class MainWindow(QMainWindow):
             for tab_id, tab_config in self.tab_configs.items():
                 is_visible = visible_tabs.get(tab_id, tab_config['default_visible'])
                 if is_visible:
-                    try:
-                        tab_config['setup_func'](self.tab_widget)
-                    except Exception as e:
-                        print(f"Error creating tab {tab_id}: {e}")
-                        # Continue with other tabs even if one fails
+                    tab_count = self.tab_widget.count()
+                    if tab_config.get('lazy', False):
+                        # Placeholder replaced by the real tab on first selection
+                        placeholder = QWidget()
+                        self._tab_builders[placeholder] = (tab_id, tab_config['setup_func'])
+                        self.tab_widget.addTab(placeholder, tab_config['name'])
+                    else:
+                        try:
+                            tab_config['setup_func'](self.tab_widget)
+                        except Exception as e:
+                            print(f"Error creating tab {tab_id}: {e}")
+                            # Continue with other tabs even if one fails
+                    if self.tab_widget.count() > tab_count:
+                        self._tab_ids.append(tab_id)
+            
+            # The tab shown first may itself be a placeholder
+            self._ensure_tab_built(self.tab_widget.currentIndex())
                         
         except Exception as e:
             print(f"Error in create_tabs: {e}")
@@ -536,6 +820,21 @@ class MainWindow(QMainWindow):
             self.setup_translation_tab(self.tab_widget)
             self.setup_tab_settings_tab(self.tab_widget)
 
+    def _ensure_tab_built(self, index):
+        """Build a lazily created tab the first time it is selected"""
+        placeholder = self.tab_widget.widget(index)
+        if placeholder not in self._tab_builders:
+            return
+        
+        tab_id, setup_func = self._tab_builders.pop(placeholder)
+        try:
+            setup_func(_PlaceholderTab(self.tab_widget, placeholder))
+        except Exception as e:
+            print(f"Error creating tab {tab_id}: {e}")
+        
+        # Messages logged before the log tab existed are still buffered
+        self._flush_log()
+    
     def setup_tab_settings_tab(self, tab_widget):
         """Setup tab for managing tab visibility"""
         settings_widget = QWidget()
@@ -587,12 +886,12 @@ class MainWindow(QMainWindow):
         
         reset_btn = QPushButton("🔄 Reset to Defaults")
         reset_btn.clicked.connect(self.reset_tab_visibility)
-        reset_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px; }")
+        reset_btn.setObjectName("resetTabs")
         button_layout.addWidget(reset_btn)
         
         apply_btn = QPushButton("✅ Apply Changes")
         apply_btn.clicked.connect(self.apply_tab_changes)
-        apply_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 8px; font-weight: bold; }")
+        apply_btn.setObjectName("applyTabs")
         button_layout.addWidget(apply_btn)
         
         button_layout.addStretch()
@@ -666,16 +965,15 @@ class MainWindow(QMainWindow):
             
             # Remember current tab
             current_index = self.tab_widget.currentIndex()
-            current_tab_text = self.tab_widget.tabText(current_index) if current_index >= 0 else ""
+            current_tab_id = self._tab_ids[current_index] if 0 <= current_index < len(self._tab_ids) else None
             
             # Recreate tabs
             self.create_tabs()
             
-            # Try to restore current tab
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabText(i) == current_tab_text:
-                    self.tab_widget.setCurrentIndex(i)
-                    break
+            # Try to restore current tab (placeholders carry a different title than
+            # the built tab, so match on the tab id)
+            if current_tab_id in self._tab_ids:
+                self.tab_widget.setCurrentIndex(self._tab_ids.index(current_tab_id))
             
             self.statusBar().showMessage("Tab visibility updated successfully!", 3000)
             
@@ -750,81 +1048,63 @@ class MainWindow(QMainWindow):
         
         # API Configuration Group
         api_group = QGroupBox("🔑 API Configuration")
-        api_layout = QGridLayout(api_group)
+        api_layout = QFormLayout(api_group)
         
         # API URL
-        api_layout.addWidget(QLabel("API URL:"), 0, 0)
         self.api_url_edit = QLineEdit()
         self.api_url_edit.setPlaceholderText("Leave blank for OpenAI API")
-        api_layout.addWidget(self.api_url_edit, 0, 1)
+        api_layout.addRow("API URL:", self.api_url_edit)
         
         # API Key
-        api_layout.addWidget(QLabel("API Key:"), 1, 0)
         self.api_key_edit = QLineEdit()
         self.api_key_edit.setEchoMode(QLineEdit.Password)
         self.api_key_edit.setPlaceholderText("Enter your API key")
-        api_layout.addWidget(self.api_key_edit, 1, 1)
+        api_key_row = QHBoxLayout()
+        api_key_row.addWidget(self.api_key_edit)
         
         # Show/Hide API Key
         self.show_key_checkbox = QCheckBox("Show API Key")
         self.show_key_checkbox.toggled.connect(self.toggle_api_key_visibility)
-        api_layout.addWidget(self.show_key_checkbox, 1, 2)
+        api_key_row.addWidget(self.show_key_checkbox)
+        api_layout.addRow("API Key:", api_key_row)
         
         # Organization
-        api_layout.addWidget(QLabel("Organization:"), 2, 0)
         self.organization_edit = QLineEdit()
         self.organization_edit.setPlaceholderText("Organization ID (optional)")
-        api_layout.addWidget(self.organization_edit, 2, 1)
+        api_layout.addRow("Organization:", self.organization_edit)
         
         # Model
-        api_layout.addWidget(QLabel("Model:"), 3, 0)
-        self.model_combo = QComboBox()
+        self.model_combo = LazyComboBox(self._populate_models)
+        # Size from a minimum length instead of measuring every model name
+        self.model_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         
         # Load models from database
         from core.models import MODEL_DB, ModelProvider
         self.model_db = MODEL_DB
         
-        # Add models grouped by provider
-        self.model_combo.addItem("--- OpenAI Models ---")
-        openai_models = self.model_db.get_models_by_provider(ModelProvider.OPENAI)
-        for model in openai_models:
-            self.model_combo.addItem(f"{model.display_name}", model.name)
-        
-        self.model_combo.addItem("--- Anthropic Models ---")
-        anthropic_models = self.model_db.get_models_by_provider(ModelProvider.ANTHROPIC)
-        for model in anthropic_models:
-            self.model_combo.addItem(f"{model.display_name}", model.name)
-        
-        self.model_combo.addItem("--- Google Models ---")
-        google_models = self.model_db.get_models_by_provider(ModelProvider.GOOGLE)
-        for model in google_models:
-            self.model_combo.addItem(f"{model.display_name}", model.name)
-        
-        self.model_combo.addItem("--- xAI Models ---")
-        xai_models = self.model_db.get_models_by_provider(ModelProvider.XAI)
-        for model in xai_models:
-            self.model_combo.addItem(f"{model.display_name}", model.name)
-        
-        self.model_combo.addItem("--- DeepSeek Models ---")
-        deepseek_models = self.model_db.get_models_by_provider(ModelProvider.DEEPSEEK)
-        for model in deepseek_models:
-            self.model_combo.addItem(f"{model.display_name}", model.name)
-        
-        self.model_combo.addItem("--- Custom Model ---")
-        self.model_combo.addItem("Custom Model", "custom")
+        # Models grouped by provider are only added when the dropdown is first opened;
+        # until then the combo just shows the configured model
+        self._models_loaded = False
+        self._model_providers = [
+            (ModelProvider.OPENAI, "OpenAI"),
+            (ModelProvider.ANTHROPIC, "Anthropic"),
+            (ModelProvider.GOOGLE, "Google"),
+            (ModelProvider.XAI, "xAI"),
+            (ModelProvider.DEEPSEEK, "DeepSeek"),
+        ]
+        self.model_combo.addItem(self.config_manager.get_value('model', 'gpt-4'))
         
         self.model_combo.setEditable(True)
         self.model_combo.currentTextChanged.connect(self.on_model_changed)
-        api_layout.addWidget(self.model_combo, 3, 1)
+        api_layout.addRow("Model:", self.model_combo)
         
         scroll_layout.addWidget(api_group)
         
         # Translation Settings Group
         translation_group = QGroupBox("🌐 Translation Settings")
-        trans_layout = QGridLayout(translation_group)
+        trans_layout = QFormLayout(translation_group)
         
         # Target Language
-        trans_layout.addWidget(QLabel("Target Language:"), 0, 0)
         self.language_combo = QComboBox()
         
         # Add supported languages from language manager
@@ -835,125 +1115,110 @@ class MainWindow(QMainWindow):
         # Connect to update prompt/vocab when language changes
         self.language_combo.currentTextChanged.connect(self.on_language_changed)
         
-        trans_layout.addWidget(self.language_combo, 0, 1)
+        trans_layout.addRow("Target Language:", self.language_combo)
         
         # Timeout
-        trans_layout.addWidget(QLabel("Timeout (seconds):"), 1, 0)
         self.timeout_spin = QSpinBox()
         self.timeout_spin.setRange(30, 300)
         self.timeout_spin.setValue(120)
-        trans_layout.addWidget(self.timeout_spin, 1, 1)
+        trans_layout.addRow("Timeout (seconds):", self.timeout_spin)
         
         # Threads
-        trans_layout.addWidget(QLabel("File Threads:"), 2, 0)
         self.file_threads_spin = QSpinBox()
         self.file_threads_spin.setRange(1, 10)
         self.file_threads_spin.setValue(1)
-        trans_layout.addWidget(self.file_threads_spin, 2, 1)
+        trans_layout.addRow("File Threads:", self.file_threads_spin)
         
-        trans_layout.addWidget(QLabel("Threads per File:"), 3, 0)
         self.threads_spin = QSpinBox()
         self.threads_spin.setRange(1, 20)
         self.threads_spin.setValue(1)
-        trans_layout.addWidget(self.threads_spin, 3, 1)
+        trans_layout.addRow("Threads per File:", self.threads_spin)
         
         # Batch Size
-        trans_layout.addWidget(QLabel("Batch Size:"), 4, 0)
         self.batch_size_spin = QSpinBox()
         self.batch_size_spin.setRange(1, 50)
         self.batch_size_spin.setValue(10)
-        trans_layout.addWidget(self.batch_size_spin, 4, 1)
+        trans_layout.addRow("Batch Size:", self.batch_size_spin)
         
         scroll_layout.addWidget(translation_group)
         
         # Text Formatting Group
         format_group = QGroupBox("📝 Text Formatting")
-        format_layout = QGridLayout(format_group)
+        format_layout = QFormLayout(format_group)
         
         # Width settings
-        format_layout.addWidget(QLabel("Dialogue Width:"), 0, 0)
         self.width_spin = QSpinBox()
         self.width_spin.setRange(40, 200)
         self.width_spin.setValue(60)
-        format_layout.addWidget(self.width_spin, 0, 1)
+        format_layout.addRow("Dialogue Width:", self.width_spin)
         
-        format_layout.addWidget(QLabel("List Width:"), 1, 0)
         self.list_width_spin = QSpinBox()
         self.list_width_spin.setRange(50, 300)
         self.list_width_spin.setValue(100)
-        format_layout.addWidget(self.list_width_spin, 1, 1)
+        format_layout.addRow("List Width:", self.list_width_spin)
         
-        format_layout.addWidget(QLabel("Note Width:"), 2, 0)
         self.note_width_spin = QSpinBox()
         self.note_width_spin.setRange(40, 200)
         self.note_width_spin.setValue(75)
-        format_layout.addWidget(self.note_width_spin, 2, 1)
+        format_layout.addRow("Note Width:", self.note_width_spin)
         
         scroll_layout.addWidget(format_group)
         
         # Cost Settings Group
         cost_group = QGroupBox("💰 API Cost Settings")
-        cost_layout = QGridLayout(cost_group)
+        cost_layout = QFormLayout(cost_group)
         
-        cost_layout.addWidget(QLabel("Input Cost (per 1K tokens):"), 0, 0)
         self.input_cost_spin = QDoubleSpinBox()
         self.input_cost_spin.setRange(0.0001, 1.0)
         self.input_cost_spin.setDecimals(4)
         self.input_cost_spin.setValue(0.002)
-        cost_layout.addWidget(self.input_cost_spin, 0, 1)
+        cost_layout.addRow("Input Cost (per 1K tokens):", self.input_cost_spin)
         
-        cost_layout.addWidget(QLabel("Output Cost (per 1K tokens):"), 1, 0)
         self.output_cost_spin = QDoubleSpinBox()
         self.output_cost_spin.setRange(0.0001, 1.0)
         self.output_cost_spin.setDecimals(4)
         self.output_cost_spin.setValue(0.002)
-        cost_layout.addWidget(self.output_cost_spin, 1, 1)
+        cost_layout.addRow("Output Cost (per 1K tokens):", self.output_cost_spin)
         
-        cost_layout.addWidget(QLabel("Frequency Penalty:"), 2, 0)
         self.frequency_penalty_spin = QDoubleSpinBox()
         self.frequency_penalty_spin.setRange(0.0, 2.0)
         self.frequency_penalty_spin.setDecimals(1)
         self.frequency_penalty_spin.setValue(0.2)
-        cost_layout.addWidget(self.frequency_penalty_spin, 2, 1)
+        cost_layout.addRow("Frequency Penalty:", self.frequency_penalty_spin)
         
         scroll_layout.addWidget(cost_group)
         
         # OpenRouter Configuration Group
         openrouter_group = QGroupBox("🌐 OpenRouter Configuration")
-        openrouter_layout = QGridLayout(openrouter_group)
+        openrouter_layout = QFormLayout(openrouter_group)
         
-        openrouter_layout.addWidget(QLabel("OpenRouter API URL:"), 0, 0)
         self.openrouter_url_edit = QLineEdit()
         self.openrouter_url_edit.setText("https://openrouter.ai/api/v1")
         self.openrouter_url_edit.setPlaceholderText("https://openrouter.ai/api/v1")
-        openrouter_layout.addWidget(self.openrouter_url_edit, 0, 1)
+        openrouter_layout.addRow("OpenRouter API URL:", self.openrouter_url_edit)
         
-        openrouter_layout.addWidget(QLabel("Site URL (optional):"), 1, 0)
         self.site_url_edit = QLineEdit()
         self.site_url_edit.setPlaceholderText("https://your-site.com")
-        openrouter_layout.addWidget(self.site_url_edit, 1, 1)
+        openrouter_layout.addRow("Site URL (optional):", self.site_url_edit)
         
-        openrouter_layout.addWidget(QLabel("App Name (optional):"), 2, 0)
         self.app_name_edit = QLineEdit()
         self.app_name_edit.setPlaceholderText("Eroge Translation Tool")
-        openrouter_layout.addWidget(self.app_name_edit, 2, 1)
+        openrouter_layout.addRow("App Name (optional):", self.app_name_edit)
         
         scroll_layout.addWidget(openrouter_group)
         
         # Ollama Configuration Group
         ollama_group = QGroupBox("🦙 Ollama Configuration")
-        ollama_layout = QGridLayout(ollama_group)
+        ollama_layout = QFormLayout(ollama_group)
         
-        ollama_layout.addWidget(QLabel("Ollama API URL:"), 0, 0)
         self.ollama_url_edit = QLineEdit()
         self.ollama_url_edit.setText("http://localhost:11434/v1")
         self.ollama_url_edit.setPlaceholderText("http://localhost:11434/v1")
-        ollama_layout.addWidget(self.ollama_url_edit, 0, 1)
+        ollama_layout.addRow("Ollama API URL:", self.ollama_url_edit)
         
-        ollama_layout.addWidget(QLabel("Model Name:"), 1, 0)
         self.ollama_model_edit = QLineEdit()
         self.ollama_model_edit.setPlaceholderText("llama3:8b")
-        ollama_layout.addWidget(self.ollama_model_edit, 1, 1)
+        ollama_layout.addRow("Model Name:", self.ollama_model_edit)
         
         scroll_layout.addWidget(ollama_group)
         
@@ -1040,18 +1305,7 @@ class MainWindow(QMainWindow):
         estimate_layout = QHBoxLayout()
         self.estimate_btn = QPushButton("📊 Estimate Project Cost")
         self.estimate_btn.clicked.connect(self.estimate_project)
-        self.estimate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.estimate_btn.setObjectName("estimate")
         estimate_layout.addWidget(self.estimate_btn)
         estimate_layout.addStretch()
         file_layout.addLayout(estimate_layout)
@@ -1089,15 +1343,15 @@ class MainWindow(QMainWindow):
         preset_layout = QHBoxLayout()
         self.rpg_recommended_btn = QPushButton("✅ Recommended Only")
         self.rpg_recommended_btn.clicked.connect(self.set_rpg_recommended_codes)
-        self.rpg_recommended_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 5px;")
+        self.rpg_recommended_btn.setObjectName("rpgRecommended")
         
         self.rpg_all_btn = QPushButton("📝 All Codes")
         self.rpg_all_btn.clicked.connect(self.set_rpg_all_codes)
-        self.rpg_all_btn.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold; padding: 5px;")
+        self.rpg_all_btn.setObjectName("rpgAll")
         
         self.rpg_dialogue_only_btn = QPushButton("💬 Dialogue Only")
         self.rpg_dialogue_only_btn.clicked.connect(self.set_rpg_dialogue_only)
-        self.rpg_dialogue_only_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; padding: 5px;")
+        self.rpg_dialogue_only_btn.setObjectName("rpgDialogueOnly")
         
         preset_layout.addWidget(self.rpg_recommended_btn)
         preset_layout.addWidget(self.rpg_dialogue_only_btn)
@@ -1145,36 +1399,14 @@ class MainWindow(QMainWindow):
         control_layout = QHBoxLayout()
         
         # Estimate button
-        self.estimate_btn = QPushButton("📊 Estimate Project")
-        self.estimate_btn.clicked.connect(self.estimate_project)
-        self.estimate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        control_layout.addWidget(self.estimate_btn)
+        self.estimate_project_btn = QPushButton("📊 Estimate Project")
+        self.estimate_project_btn.clicked.connect(self.estimate_project)
+        self.estimate_project_btn.setObjectName("estimateProject")
+        control_layout.addWidget(self.estimate_project_btn)
         
         self.start_btn = QPushButton("🚀 Start Translation")
         self.start_btn.clicked.connect(self.start_translation)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.start_btn.setObjectName("start")
         control_layout.addWidget(self.start_btn)
         
         self.pause_btn = QPushButton("⏸️ Pause")
@@ -1412,12 +1644,12 @@ class MainWindow(QMainWindow):
         
         self.ln_estimate_btn = QPushButton("💰 Estimate Cost")
         self.ln_estimate_btn.clicked.connect(self.estimate_lightnovel_cost)
-        self.ln_estimate_btn.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold; padding: 8px;")
+        self.ln_estimate_btn.setObjectName("lnEstimate")
         control_layout.addWidget(self.ln_estimate_btn)
         
         self.ln_translate_btn = QPushButton("🚀 Start Translation")
         self.ln_translate_btn.clicked.connect(self.start_lightnovel_translation)
-        self.ln_translate_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 8px;")
+        self.ln_translate_btn.setObjectName("lnTranslate")
         control_layout.addWidget(self.ln_translate_btn)
         
         self.ln_pause_btn = QPushButton("⏸️ Pause")
@@ -1825,7 +2057,7 @@ class MainWindow(QMainWindow):
         # Re-transcribe button
         self.retranscribe_btn = QPushButton("🔄 Re-transcribe Segment")
         self.retranscribe_btn.clicked.connect(self.start_segment_retranscription)
-        self.retranscribe_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px; font-weight: bold; }")
+        self.retranscribe_btn.setObjectName("retranscribe")
         self.retranscribe_btn.setEnabled(False)  # Enable when both audio and subtitle files are selected
         segment_layout.addWidget(self.retranscribe_btn, 3, 0, 1, 4)
         
@@ -1840,7 +2072,7 @@ class MainWindow(QMainWindow):
         
         self.transcribe_btn = QPushButton("🎯 Start Transcription")
         self.transcribe_btn.clicked.connect(self.start_transcription)
-        self.transcribe_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 10px; font-weight: bold; }")
+        self.transcribe_btn.setObjectName("transcribe")
         action_layout.addWidget(self.transcribe_btn)
         
         self.stop_transcription_btn = QPushButton("⏹️ Stop")
@@ -1907,7 +2139,7 @@ class MainWindow(QMainWindow):
         self.hide_deps_btn = QPushButton("✕")
         self.hide_deps_btn.clicked.connect(lambda: self.deps_warning_group.setVisible(False))
         self.hide_deps_btn.setMaximumSize(25, 25)
-        self.hide_deps_btn.setStyleSheet("QPushButton { background-color: #ccc; border: none; border-radius: 12px; }")
+        self.hide_deps_btn.setObjectName("hideDeps")
         self.hide_deps_btn.setToolTip("Hide dependencies warning")
         deps_header_layout.addWidget(self.hide_deps_btn)
         deps_layout.addLayout(deps_header_layout)
@@ -1920,12 +2152,12 @@ class MainWindow(QMainWindow):
         button_layout = QHBoxLayout()
         self.install_deps_btn = QPushButton("📦 Install Missing Dependencies")
         self.install_deps_btn.clicked.connect(self.show_dependency_install_dialog)
-        self.install_deps_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px; }")
+        self.install_deps_btn.setObjectName("installDeps")
         button_layout.addWidget(self.install_deps_btn)
         
         self.recheck_deps_btn = QPushButton("🔄 Recheck Dependencies")
         self.recheck_deps_btn.clicked.connect(self.recheck_dependencies)
-        self.recheck_deps_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
+        self.recheck_deps_btn.setObjectName("recheckDeps")
         button_layout.addWidget(self.recheck_deps_btn)
         deps_layout.addLayout(button_layout)
         
@@ -2035,7 +2267,7 @@ class MainWindow(QMainWindow):
         # Copy button
         copy_btn = QPushButton("📋 Copy Commands")
         copy_btn.clicked.connect(lambda: QApplication.clipboard().setText('\n'.join(commands)))
-        copy_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
+        copy_btn.setObjectName("copyCommands")
         layout.addWidget(copy_btn)
         
         # Note
@@ -2322,7 +2554,7 @@ class MainWindow(QMainWindow):
         
         self.generate_char_btn = QPushButton("🎲 Generate Character")
         self.generate_char_btn.clicked.connect(self.generate_character)
-        self.generate_char_btn.setStyleSheet("QPushButton { background-color: #9C27B0; color: white; padding: 10px; font-weight: bold; }")
+        self.generate_char_btn.setObjectName("generateCharacter")
         char_info_layout.addWidget(self.generate_char_btn)
         
         char_display_layout.addLayout(char_info_layout)
@@ -2523,7 +2755,7 @@ class MainWindow(QMainWindow):
         
         self.generate_text_btn = QPushButton("✨ Generate with AI")
         self.generate_text_btn.clicked.connect(self.generate_writing)
-        self.generate_text_btn.setStyleSheet("QPushButton { background-color: #FF5722; color: white; padding: 8px; font-weight: bold; }")
+        self.generate_text_btn.setObjectName("generateText")
         tools_layout.addWidget(self.generate_text_btn)
         
         left_layout.addWidget(tools_group)
@@ -2625,7 +2857,7 @@ class MainWindow(QMainWindow):
         
         self.download_model_btn = QPushButton("📥 Download Selected Model")
         self.download_model_btn.clicked.connect(self.download_selected_model)
-        self.download_model_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 8px; font-weight: bold; }")
+        self.download_model_btn.setObjectName("downloadModel")
         model_actions_layout.addWidget(self.download_model_btn)
         
         self.refresh_models_btn = QPushButton("🔄 Refresh List")
@@ -3268,51 +3500,15 @@ class MainWindow(QMainWindow):
         
         github_btn = QPushButton("🐛 Report Issues")
         github_btn.clicked.connect(lambda: self.open_url("https://github.com/Baconana-chan/BaconanaMTLTool/issues"))
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        github_btn.setObjectName("github")
         
         kofi_btn = QPushButton("☕ Support Development")
         kofi_btn.clicked.connect(lambda: self.open_url("https://ko-fi.com/baconana_chan"))
-        kofi_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff5722;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e64a19;
-            }
-        """)
+        kofi_btn.setObjectName("kofi")
         
         original_btn = QPushButton("🌟 Original Tool")
         original_btn.clicked.connect(lambda: self.open_url("https://gitgud.io/DazedAnon/DazedMTLTool"))
-        original_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6f42c1;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a359a;
-            }
-        """)
+        original_btn.setObjectName("original")
         
         button_layout.addWidget(github_btn)
         button_layout.addWidget(kofi_btn)
@@ -3351,8 +3547,9 @@ class MainWindow(QMainWindow):
         layout.addLayout(log_controls)
         
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(10000)
         self.log_display.setFont(QFont("Consolas", 9))
         layout.addWidget(self.log_display)
         
@@ -3376,12 +3573,50 @@ class MainWindow(QMainWindow):
                 self.log_message(f"Context length: {model_info.context_length:,} tokens")
                 self.log_message(f"Pricing updated: ${pricing['input_cost']:.4f} input, ${pricing['output_cost']:.4f} output per 1K tokens")
     
+    def _populate_models(self):
+        """Fill the model combo with all known models, grouped by provider"""
+        if self._models_loaded:
+            return
+        self._models_loaded = True
+        
+        # Build the whole item model first and hand it to the combo in one go
+        items = QStandardItemModel(self.model_combo)
+        
+        def add_header(text):
+            header = QStandardItem(text)
+            header.setFlags(Qt.NoItemFlags)
+            items.appendRow(header)
+        
+        def add_model(text, name):
+            item = QStandardItem(text)
+            item.setData(name, Qt.UserRole)
+            items.appendRow(item)
+        
+        # Group the model database by provider in a single pass
+        models_by_provider = defaultdict(list)
+        for model in self.model_db.get_all_models():
+            models_by_provider[model.provider].append(model)
+        
+        for provider, provider_name in self._model_providers:
+            add_header(f"--- {provider_name} Models ---")
+            for model in models_by_provider[provider]:
+                add_model(f"{model.display_name}", model.name)
+        
+        add_header("--- Custom Model ---")
+        add_model("Custom Model", "custom")
+        
+        # Keep the typed/configured model text and don't trigger on_model_changed
+        current_text = self.model_combo.currentText()
+        self.model_combo.setUpdatesEnabled(False)
+        self.model_combo.blockSignals(True)
+        self.model_combo.setModel(items)
+        self.model_combo.setEditText(current_text)
+        self.model_combo.blockSignals(False)
+        self.model_combo.setUpdatesEnabled(True)
+    
     def toggle_api_key_visibility(self, show):
         """Toggle API key visibility"""
-        if show:
-            self.api_key_edit.setEchoMode(QLineEdit.Normal)
-        else:
-            self.api_key_edit.setEchoMode(QLineEdit.Password)
+        self.api_key_edit.setEchoMode(self._ECHO_MODES[bool(show)])
     
     def browse_input_directory(self):
         """Browse for input directory or file based on selected mode"""
@@ -3438,96 +3673,97 @@ class MainWindow(QMainWindow):
                 self.rpg_maker_group.setVisible(False)
     
     def detect_project_type(self, directory):
-        """Detect and display project type"""
-        from core.renpy_processor import RenpyProcessor
-        from core.unity_processor import UnityProcessor
-        from core.wolf_processor import WolfProcessor
-        from core.kirikiri_processor import KiriKiriProcessor
-        from core.nscripter_processor import NScripterProcessor
-        from core.livemaker_processor import LiveMakerProcessor
-        from core.tyranobuilder_processor import TyranoBuilderProcessor
-        from core.srpg_studio_processor import SRPGStudioProcessor
-        from core.lune_processor import LuneProcessor
-        from core.regex_processor import RegexProcessor
-        from core.lightnovel_processor import LightNovelProcessor
-        
-        renpy_processor = RenpyProcessor()
-        unity_processor = UnityProcessor()
-        wolf_processor = WolfProcessor()
-        kirikiri_processor = KiriKiriProcessor()
-        nscripter_processor = NScripterProcessor()
-        livemaker_processor = LiveMakerProcessor()
-        tyranobuilder_processor = TyranoBuilderProcessor()
-        srpg_studio_processor = SRPGStudioProcessor()
-        lune_processor = LuneProcessor()
-        regex_processor = RegexProcessor()
-        lightnovel_processor = LightNovelProcessor()
-        
-        # Check for light novel files first (they could be mistaken for other formats)
-        if self.detect_lightnovel_project(directory, lightnovel_processor):
-            self.project_type_label.setText("✅ Light Novel project detected")
-            self.project_type_label.setStyleSheet("color: #8E24AA; font-weight: bold;")
-            if hasattr(self, 'rpg_maker_group'):
-                self.rpg_maker_group.setVisible(False)
-        elif self.detect_rpg_maker_project(directory):
-            self.project_type_label.setText("✅ RPG Maker project detected")
-            self.project_type_label.setStyleSheet("color: #2196F3; font-weight: bold;")
-            # Show RPG Maker configuration options
-            if hasattr(self, 'rpg_maker_group'):
-                self.rpg_maker_group.setVisible(True)
-            self.update_rpg_cost_estimate()
-        elif renpy_processor.detect_renpy_project(directory):
-            self.project_type_label.setText("✅ Ren'Py project detected")
-            self.project_type_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            if hasattr(self, 'rpg_maker_group'):
-                self.rpg_maker_group.setVisible(False)
-        elif unity_processor.detect_unity_project(directory):
-            self.project_type_label.setText("✅ Unity project detected")
-            self.project_type_label.setStyleSheet("color: #9C27B0; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif wolf_processor.detect_wolf_project(directory):
-            self.project_type_label.setText("✅ Wolf RPG Editor project detected")
-            self.project_type_label.setStyleSheet("color: #FF5722; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif kirikiri_processor.detect_kirikiri_project(directory):
-            self.project_type_label.setText("✅ KiriKiri project detected")
-            self.project_type_label.setStyleSheet("color: #3F51B5; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif nscripter_processor.detect_nscripter_project(directory):
-            self.project_type_label.setText("✅ NScripter project detected")
-            self.project_type_label.setStyleSheet("color: #009688; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif len(livemaker_processor.find_livemaker_files(directory)) > 0:
-            self.project_type_label.setText("✅ Live Maker project detected")
-            self.project_type_label.setStyleSheet("color: #E91E63; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif len(tyranobuilder_processor.find_tyranobuilder_files(directory)) > 0:
-            self.project_type_label.setText("✅ TyranoBuilder project detected")
-            self.project_type_label.setStyleSheet("color: #9C27B0; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif len(srpg_studio_processor.find_srpg_studio_files(directory)) > 0:
-            self.project_type_label.setText("✅ SRPG Studio project detected")
-            self.project_type_label.setStyleSheet("color: #607D8B; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif len(lune_processor.find_lune_files(directory)) > 0:
-            self.project_type_label.setText("✅ Lune project detected")
-            self.project_type_label.setStyleSheet("color: #FF9800; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif len(regex_processor.find_regex_files(directory)) > 0:
-            self.project_type_label.setText("✅ Regex project detected")
-            self.project_type_label.setStyleSheet("color: #CDDC39; font-weight: bold;")
-            self.rpg_maker_group.setVisible(False)
-        elif self.detect_rpg_maker_project(directory):
-            self.project_type_label.setText("✅ RPG Maker project detected")
-            self.project_type_label.setStyleSheet("color: #2196F3; font-weight: bold;")
-            # Show RPG Maker configuration options
-            self.rpg_maker_group.setVisible(True)
+        """Detect and display project type in the background"""
+        self.project_type_label.setText("🔍 Detecting project type...")
+        self.project_type_label.setStyleSheet("color: #666; font-style: italic;")
+        
+        # Parented to the window so a detection still running when another directory
+        # is picked isn't destroyed with its Python reference
+        self.project_detection_thread = ProjectDetectionThread(self.scan_project_type, directory, self)
+        self.project_detection_thread.detected.connect(self._apply_project_type_label)
+        self.project_detection_thread.finished.connect(self.project_detection_thread.deleteLater)
+        self.project_detection_thread.start()
+    
+    def _apply_project_type_label(self, directory, project_type):
+        """Show a detection result from ProjectDetectionThread"""
+        # A newer directory was selected while this one was being scanned
+        if directory != self.input_dir_edit.text():
+            return
+        
+        text, style = DETECT_RESULTS[project_type]
+        is_rpg_maker = project_type == 'rpg_maker'
+        self.project_type_label.setText(text)
+        self.project_type_label.setStyleSheet(style)
+        if hasattr(self, 'rpg_maker_group'):
+            # Show RPG Maker configuration options only for RPG Maker projects
+            self.rpg_maker_group.setVisible(is_rpg_maker)
+        if is_rpg_maker:
             self.update_rpg_cost_estimate()
-        else:
-            self.project_type_label.setText("⚠️ No supported project detected")
-            self.project_type_label.setStyleSheet("color: #FF9800; font-weight: bold;")
-            # Hide RPG Maker configuration for non-RPG Maker projects
-            self.rpg_maker_group.setVisible(False)
+    
+    def scan_project_type(self, directory):
+        """Detect the project type of directory.
+        
+        Touches no widgets so it can run off the GUI thread. Returns a
+        PROJECT_PROBES key, or None when nothing matched, cached while the
+        mtimes of the directory and its DETECT_WATCHED_SUBDIRS are unchanged.
+        """
+        try:
+            key = (os.path.abspath(directory), os.stat(directory).st_mtime_ns,
+                   tuple(self._dir_mtime(os.path.join(directory, sub)) for sub in DETECT_WATCHED_SUBDIRS))
+        except OSError:
+            return self._scan_project_type_uncached(directory)
+        
+        with _detect_cache_lock:
+            if key in _detect_cache:
+                return _detect_cache[key]
+        
+        result = self._scan_project_type_uncached(directory)
+        with _detect_cache_lock:
+            _detect_cache[key] = result
+            while len(_detect_cache) > DETECT_CACHE_SIZE:
+                del _detect_cache[next(iter(_detect_cache))]
+        return result
+    
+    def _dir_mtime(self, path):
+        """mtime of path, or None when it doesn't exist so creating it changes the cache key"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _scan_project_type_uncached(self, directory):
+        procs = _get_processors()
+        
+        checks = {
+            'lightnovel': lambda d: self.detect_lightnovel_project(d, procs['lightnovel']),
+            'rpg_maker': self.detect_rpg_maker_project,
+            'renpy': procs['renpy'].detect_renpy_project,
+            'unity': procs['unity'].detect_unity_project,
+            'wolf': procs['wolf'].detect_wolf_project,
+            'kirikiri': procs['kirikiri'].detect_kirikiri_project,
+            'nscripter': procs['nscripter'].detect_nscripter_project,
+            'livemaker': lambda d: len(procs['livemaker'].find_livemaker_files(d)) > 0,
+            'tyranobuilder': lambda d: len(procs['tyranobuilder'].find_tyranobuilder_files(d)) > 0,
+            'srpg_studio': lambda d: len(procs['srpg_studio'].find_srpg_studio_files(d)) > 0,
+            'lune': lambda d: len(procs['lune'].find_lune_files(d)) > 0,
+            'regex': lambda d: len(procs['regex'].find_regex_files(d)) > 0,
+        }
+        
+        # The probes are independent directory scans, so run them all at once and
+        # take the first hit in priority order
+        executor = ThreadPoolExecutor(max_workers=len(PROJECT_PROBES))
+        futures = [(key, executor.submit(checks[key], directory)) for key in PROJECT_PROBES]
+        try:
+            for key, future in futures:
+                if future.result():
+                    return key
+        finally:
+            # Lower-priority probes still queued are no longer needed
+            for _, future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        return None
     
     def detect_rpg_maker_project(self, directory):
         """Detect if directory contains RPG Maker project"""
@@ -3539,14 +3775,14 @@ class MainWindow(QMainWindow):
         ]
         
         for path in possible_paths:
-            if os.path.exists(path):
+            if os.path.isdir(path):
                 try:
-                    # Look for RPG Maker JSON files
-                    for file in os.listdir(path):
-                        if file.endswith('.json') and any(
-                            pattern in file for pattern in ['Map', 'CommonEvents', 'System', 'Actors', 'Classes']
-                        ):
-                            return True
+                    # Look for RPG Maker JSON files, stopping at the first one
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            name = entry.name
+                            if name.endswith('.json') and name.startswith(RPG_MAKER_DATA_PREFIXES):
+                                return True
                 except (PermissionError, OSError):
                     continue
         
@@ -3923,7 +4159,18 @@ class MainWindow(QMainWindow):
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
         
-        self.log_display.append(formatted_message)
+        self._log_buf.append(formatted_message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append buffered log messages to the log display in one go"""
+        if not self._log_buf or not hasattr(self, 'log_display'):
+            return
+        
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.log_display.appendPlainText(text)
         
         if self.auto_scroll_checkbox.isChecked():
             cursor = self.log_display.textCursor()
@@ -3932,6 +4179,7 @@ class MainWindow(QMainWindow):
     
     def clear_log(self):
         """Clear log display"""
+        self._log_buf.clear()
         self.log_display.clear()
     
     def save_log(self):
@@ -3939,6 +4187,7 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(self, "Save Log", "translation_log.txt", "Text files (*.txt)")
         if filename:
             try:
+                self._flush_log()
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(self.log_display.toPlainText())
                 QMessageBox.information(self, "Success", "Log saved successfully!")
@@ -6617,16 +6866,18 @@ Max section length: {estimate.get('max_section_length', 5000)} characters
             self.test_model_combo.clear()
             
             # Populate available models
-            for model_key, model_info in self.llamacpp_client.available_models.items():
-                display_text = f"{model_info['name']} ({model_info['size']}) - {model_info['description']}"
-                self.available_models_list.addItem(display_text)
-                self.available_models_list.item(self.available_models_list.count() - 1).setData(Qt.UserRole, model_key)
+            available = self.llamacpp_client.available_models
+            self.available_models_list.addItems([
+                f"{model_info['name']} ({model_info['size']}) - {model_info['description']}"
+                for model_info in available.values()
+            ])
+            for row, model_key in enumerate(available):
+                self.available_models_list.item(row).setData(Qt.UserRole, model_key)
             
             # Populate installed models
             installed = self.llamacpp_client.get_installed_models()
-            for model_name in installed:
-                self.installed_models_list.addItem(model_name)
-                self.test_model_combo.addItem(model_name)
+            self.installed_models_list.addItems(installed)
+            self.test_model_combo.addItems(installed)
             
             self.local_status_label.setText(f"Ready - {len(installed)} models installed")
             
@@ -7185,8 +7436,7 @@ Location: models/llamacpp/{model_name}.gguf
                 self.novel_db = NovelDatabase()
             
             projects = self.novel_db.get_all_projects()
-            for project in projects:
-                self.novel_project_combo.addItem(project.title)
+            self.novel_project_combo.addItems([project.title for project in projects])
                 
         except Exception as e:
             self.log_message(f"Error loading projects: {str(e)}", "error")